@@ -33,7 +33,9 @@ import hashlib
 import logging
 import os
 import re
+import sys
 from enum import Enum
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
@@ -101,6 +103,12 @@ _DANGER_RE = re.compile("|".join(_DANGER_PATTERNS), re.IGNORECASE)
 _CAUTION_RE = re.compile("|".join(_CAUTION_PATTERNS), re.IGNORECASE)
 
 
+# Calls whose argument is user-directed content rather than an instruction.
+# A plain prefix test: the anchored regex this replaces compiled nothing a
+# str.startswith() couldn't answer, and it ran on every computer_call.
+_CONTENT_CALL_PREFIXES = ("computer.keyboard.type(", "computer.clipboard.set(")
+
+
 def _action_text(action: "ActionModel", element_context: str = "") -> str:
     """Extract the human-readable text of an action for risk classification.
 
@@ -121,7 +129,7 @@ def _action_text(action: "ActionModel", element_context: str = "") -> str:
         call = computer_call.call
         # Strip content of typing/clipboard actions — content is user-directed text,
         # not an agent action, so scanning it for "format", "rm", etc. causes false positives.
-        if re.match(r"computer\.(keyboard\.type|clipboard\.set)\(", call):
+        if call.startswith(_CONTENT_CALL_PREFIXES):
             # Keep only the method name for classification
             parts.append(call.split("(")[0])
         else:
@@ -156,9 +164,23 @@ class ApprovalGuard:
     """
 
     def __init__(self, mode: str | None = None) -> None:
-        self.mode = (mode or os.getenv("AUTOBOT_APPROVAL_MODE", "balanced")).lower()
+        # Interned so gate()'s per-action `self.mode == "trusted"` checks
+        # resolve on the identity fast path against the (interned) literals.
+        self.mode = sys.intern((mode or os.getenv("AUTOBOT_APPROVAL_MODE", "balanced")).lower())
+        # (action, element_context, text) for the most recent classification.
+        # The loop always calls classify() and then gate() on the same action,
+        # so gate() can reuse the text instead of rebuilding it.
+        self._last_text: tuple[Any, str, str] | None = None
         logger.info(f"ApprovalGuard active — mode: {self.mode}")
 
+    def _text_for(self, action: "ActionModel", element_context: str) -> str:
+        last = self._last_text
+        if last is not None and last[0] is action and last[1] == element_context:
+            return last[2]
+        text = _action_text(action, element_context=element_context)
+        self._last_text = (action, element_context, text)
+        return text
+
     def classify(self, action: "ActionModel", element_context: str = "") -> RiskTier:
         """Classify an action into SAFE / CAUTION / DANGER / IRREVERSIBLE.
 
@@ -168,7 +190,7 @@ class ApprovalGuard:
         (type="password", "card number", etc.) works off the FIELD, not the
         arbitrary text being typed into it.
         """
-        text = _action_text(action, element_context=element_context)
+        text = self._text_for(action, element_context)
         if _IRREVERSIBLE_RE.search(text):
             return RiskTier.IRREVERSIBLE
         if _DANGER_RE.search(text):
@@ -198,12 +220,12 @@ class ApprovalGuard:
 
         Returns True to proceed, False to skip this action.
         """
-        text = _action_text(action, element_context=element_context)
-        tier_label = tier.value.upper()
-
         if tier == RiskTier.SAFE:
             return True
 
+        text = self._text_for(action, element_context)
+        tier_label = tier.value.upper()
+
         if tier == RiskTier.IRREVERSIBLE:
             return await self._request_approval(text, tier_label, goal, timeout)
 
@@ -249,21 +271,41 @@ class ApprovalGuard:
 
 # ── Desktop notification ──────────────────────────────────────────────────────
 
+@cache
+def _notifier_path(name: str) -> str | None:
+    """Absolute path of a notification helper, or None if it isn't on PATH.
+
+    shutil.which() stats every PATH entry, and an approval-heavy run can
+    notify on every gated action. Installed tools don't come and go while the
+    agent runs, so resolve each one once per process.
+    """
+    import shutil
+    return shutil.which(name)
+
+
 def _send_notification(title: str, body: str) -> None:
     """Send a best-effort desktop notification. Never raises."""
     import platform
     import subprocess
     system = platform.system()
+    # On POSIX, an absolute executable path plus close_fds=False lets CPython
+    # start the child with posix_spawn instead of fork+exec, so the agent's
+    # (large) address space is never duplicated just to pop a notification.
+    # Python's own fds are non-inheritable by default, so nothing leaks.
     try:
         if system == "Linux":
-            subprocess.Popen(
-                ["notify-send", "--urgency=normal", "--expire-time=8000", title, body],
-                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-            )
+            exe = _notifier_path("notify-send")
+            if exe:
+                subprocess.Popen(
+                    [exe, "--urgency=normal", "--expire-time=8000", title, body],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False,
+                )
         elif system == "Darwin":
             script = f'display notification "{body[:200]}" with title "{title}"'
-            subprocess.Popen(["osascript", "-e", script],
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            exe = _notifier_path("osascript")
+            if exe:
+                subprocess.Popen([exe, "-e", script],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
         elif system == "Windows":
             ps = (f"Add-Type -AssemblyName System.Windows.Forms; "
                   f"[System.Windows.Forms.MessageBox]::Show('{body[:200]}','{title}')")
@@ -24,6 +24,7 @@ import json
 import logging
 import os
 import time
+from collections import deque
 from pathlib import Path
 from typing import Any, Callable
 
@@ -39,6 +40,9 @@ logger = logging.getLogger(__name__)
 # the user is actually doing.
 _BLOCKED_MODULES = SCREEN_MODULES
 
+# How many past tool calls are replayed into each step's prompt.
+_HISTORY_STEPS = 10
+
 # Short system prompt for background tasks (no vision section — saves ~3,000 tokens/step)
 _BACKGROUND_SYSTEM_PROMPT = """
 You are a background automation agent. You have NO screen access and cannot see, click, or type.
@@ -99,7 +103,10 @@ class BackgroundTaskRunner:
         self.step_number = 0
         self.status: str = "idle"
         self.result: str = ""
-        self._history: list[dict] = []   # lightweight text history (no screenshots)
+        # Lightweight text history (no screenshots). Only the last
+        # _HISTORY_STEPS entries are ever put in the prompt, so a bounded deque
+        # drops older ones on append instead of re-slicing the list each step.
+        self._history: deque[dict] = deque(maxlen=_HISTORY_STEPS)
 
     @classmethod
     def from_env(
@@ -164,9 +171,6 @@ class BackgroundTaskRunner:
                         "call": call_str,
                         "result": str(result)[:300],
                     })
-                    # Keep last 15 steps in history
-                    if len(self._history) > 15:
-                        self._history = self._history[-15:]
 
             await asyncio.sleep(0.5)
 
@@ -179,7 +183,7 @@ class BackgroundTaskRunner:
         """Call the LLM with current task context. Returns parsed JSON dict or None."""
         history_text = "\n".join(
             f"Step {h['step']}: {h['goal']}\n  → {h['call']}\n  Result: {h['result']}"
-            for h in self._history[-10:]
+            for h in self._history
         ) or "(no history yet)"
 
         user_content = (
@@ -6,11 +6,50 @@ Solves the historical Overleaf button stall issue where custom React/Shadow DOM
 stutter or fail under basic DOM clicks.
 """
 import logging
+import weakref
+from functools import lru_cache
 from typing import Any
 
+try:
+    # Base class of every Playwright failure, TimeoutError included.
+    from playwright.async_api import Error as PlaywrightError
+except ImportError:  # the helper only ever runs against a live Playwright page
+    PlaywrightError = Exception  # type: ignore[misc,assignment]
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _selector_union(selectors: tuple[str, ...]) -> str:
+    """Join candidates into one Playwright selector list ("a, b, c").
+
+    Playwright accepts its own pseudo-classes (:has-text() etc.) inside a
+    comma-separated list, so a single count() on the union answers "does
+    any of these match?" for the whole group.
+    """
+    return ", ".join(selectors)
+
+
+# page → {element_key: selector that last clicked on the current document}.
+# Weak so a closed page doesn't pin its entry; cleared whenever the main
+# frame navigates, since a selector that won on one screen says nothing
+# about the next.
+_PAGE_HITS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _page_hits(page: Any) -> dict[str, str]:
+    hits = _PAGE_HITS.get(page)
+    if hits is None:
+        hits = _PAGE_HITS[page] = {}
+
+        def _on_navigated(frame: Any) -> None:
+            if frame.parent_frame is None:
+                hits.clear()
+
+        page.on("framenavigated", _on_navigated)
+    return hits
+
+
 class OverleafHelper:
     """
     Resilient automation helpers for Overleaf project creation, CodeMirror editor input,
@@ -58,20 +97,95 @@ class OverleafHelper:
         ],
     }
 
+    # Checks every candidate selector in one page.evaluate() round-trip.
+    # Per selector: true = first match is visible, false = no visible match,
+    # null = not plain CSS (Playwright's :has-text() etc. make querySelector
+    # throw), so only Playwright itself can answer for it.
+    _VISIBILITY_JS = """(sels) => sels.map((s) => {
+        let el;
+        try { el = document.querySelector(s); } catch (e) { return null; }
+        if (!el || !el.getClientRects().length) return false;
+        return getComputedStyle(el).visibility !== 'hidden';
+    })"""
+
+    # Replaces the whole editor document in one page.evaluate() round-trip via
+    # whichever editor API the page exposes: CodeMirror 6 (current Overleaf),
+    # CodeMirror 5, then Ace. Returns false when none is reachable so the
+    # caller can fall back to keyboard input.
+    _SET_EDITOR_JS = """(text) => {
+        const cm6 = document.querySelector('.cm-content');
+        const view = cm6 && cm6.cmView && cm6.cmView.view;
+        if (view) {
+            view.dispatch({changes: {from: 0, to: view.state.doc.length, insert: text}});
+            return true;
+        }
+        const cm5 = document.querySelector('.CodeMirror');
+        if (cm5 && cm5.CodeMirror) { cm5.CodeMirror.setValue(text); return true; }
+        const ace = window._editor || (window.ace && document.querySelector('.ace_editor')
+            && window.ace.edit(document.querySelector('.ace_editor')));
+        if (ace && ace.setValue) { ace.setValue(text, 1); return true; }
+        return false;
+    }"""
+
+    @classmethod
+    async def _probe_visibility(cls, page: Any, selectors: list[str]) -> list[bool | None]:
+        try:
+            result = await page.evaluate(cls._VISIBILITY_JS, selectors)
+            if isinstance(result, list) and len(result) == len(selectors):
+                return result
+        except PlaywrightError as e:
+            logger.debug(f"Batched visibility probe failed: {e}")
+        return [None] * len(selectors)
+
     @classmethod
     async def find_and_click(cls, page: Any, element_key: str) -> bool:
         """
         Attempts to click an Overleaf UI element by iterating through robust fallback selectors.
+
+        Visibility of every plain-CSS candidate is checked in a single
+        evaluate() call instead of a count() + is_visible() round-trip per
+        selector; only Playwright-specific selectors are probed one by one.
+        Selector priority order is unchanged.
+
+        A Playwright-specific selector that already won on this page's
+        current document skips the union count() and goes straight to its
+        own is_visible() check.
         """
+        hits = _page_hits(page)
+        cached = hits.get(element_key)
         selectors = cls.SELECTORS.get(element_key, [])
-        for sel in selectors:
+        visible = await cls._probe_visibility(page, selectors)
+        # Playwright-only selectors the batched probe couldn't answer. One
+        # count() on their union rules them all out when none match, instead
+        # of a count() round-trip per selector; individual probes (which keep
+        # the priority order) only run when something does match. With a
+        # single unresolved candidate that count() would just repeat the
+        # is_visible() probe below, so it is skipped.
+        unresolved = tuple(sel for sel, v in zip(selectors, visible) if v is None)
+        none_unresolved_match: bool | None = False if len(unresolved) == 1 else None
+        for sel, is_visible in zip(selectors, visible):
+            if is_visible is False:
+                continue
             try:
                 locator = page.locator(sel)
-                if await locator.count() > 0 and await locator.first.is_visible():
-                    await locator.first.click(timeout=3000)
-                    logger.info(f"✨ OverleafHelper: Successfully clicked '{element_key}' using selector '{sel}'")
-                    return True
-            except Exception as e:
+                if is_visible is None:
+                    if none_unresolved_match is None and sel != cached:
+                        none_unresolved_match = await page.locator(_selector_union(unresolved)).count() == 0
+                    # is_visible() is simply False when nothing matches, so
+                    # no separate count() round-trip is needed first.
+                    if none_unresolved_match or not await locator.first.is_visible():
+                        continue
+                await locator.first.click(timeout=3000)
+                if is_visible is None:
+                    # Only selectors the batched probe can't answer are
+                    # remembered; plain CSS is re-checked by it every time.
+                    hits[element_key] = sel
+                logger.info(f"✨ OverleafHelper: Successfully clicked '{element_key}' using selector '{sel}'")
+                return True
+            except PlaywrightError as e:
+                # Narrowed on purpose: a missing/detached/obscured element is
+                # expected here and means "try the next selector", but a bug in
+                # this code should surface rather than read as "not found".
                 logger.debug(f"Selector '{sel}' attempt failed: {e}")
 
         logger.warning(f"⚠️ OverleafHelper: Could not click '{element_key}' with primary selectors. Falling back to visual/coordinate click.")
@@ -91,11 +205,20 @@ class OverleafHelper:
             except Exception:
                 pass
 
-        # Step 2: Select all existing content (Ctrl+A)
+        # Step 2: Replace the document through the editor API when possible —
+        # one round-trip instead of select-all + delete + paste/insert.
+        try:
+            if await page.evaluate(cls._SET_EDITOR_JS, latex_code):
+                logger.info("🧩 Injected LaTeX code via editor API")
+                return True
+        except PlaywrightError as e:
+            logger.debug(f"Editor API injection failed, falling back to keyboard: {e}")
+
+        # Step 3: Select all existing content (Ctrl+A)
         await page.keyboard.press("Control+a")
         await page.keyboard.press("Backspace")
 
-        # Step 3: Paste LaTeX code via clipboard or fill
+        # Step 4: Paste LaTeX code via clipboard or fill
         if computer_clipboard:
             computer_clipboard.set(latex_code)
             await page.keyboard.press("Control+v")
@@ -28,6 +28,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from collections import deque
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -48,7 +49,10 @@ _user_message_queue: list[dict[str, Any]] = []
 
 # ── Agent → User messages (narrative / questions) ────────────────────────────
 # The agent can surface thoughts or questions; the frontend polls these.
-_agent_messages: list[dict[str, Any]] = []
+# Only the last 50 are kept: the deque drops the oldest on append, where
+# list.pop(0) shifted every remaining entry.
+_AGENT_MESSAGE_CAP = 50
+_agent_messages: deque[dict[str, Any]] = deque(maxlen=_AGENT_MESSAGE_CAP)
 
 
 def inject_user_message(text: str) -> None:
@@ -69,14 +73,20 @@ def push_agent_message(text: str, kind: str = "narrative") -> None:
     """Agent surfaces a thought or question to the user."""
     import time
     _agent_messages.append({"text": text, "kind": kind, "ts": time.time()})
-    # Keep only the last 50 to avoid unbounded growth
-    if len(_agent_messages) > 50:
-        _agent_messages.pop(0)
 
 
 def get_agent_messages(since_ts: float = 0.0) -> list[dict[str, Any]]:
     """Return agent messages newer than since_ts for the frontend to display."""
-    return [m for m in _agent_messages if m["ts"] > since_ts]
+    # Messages are appended in time order, so walk back from the newest and
+    # stop at the first one already seen — a poll that finds nothing new
+    # touches one entry instead of all of them.
+    newer: list[dict[str, Any]] = []
+    for m in reversed(_agent_messages):
+        if m["ts"] <= since_ts:
+            break
+        newer.append(m)
+    newer.reverse()
+    return newer
 
 
 async def wait_for_approval(
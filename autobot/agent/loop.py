@@ -22,25 +22,35 @@ import asyncio
 import json
 import logging
 import os
+import re
+import threading
 import time
+from functools import lru_cache
 from typing import Any
 
 from autobot.agent.approval import ApprovalGuard, RiskTier
 from autobot.agent.models import (
+    ACTION_NAMES,
     ActionModel,
     ActionResult,
     AgentOutput,
     AgentStepInfo,
     ClickAction,
+    CloseTabAction,
     ComputerCallAction,
     DoneAction,
+    GoBackAction,
     InputTextAction,
     NavigateAction,
+    NewTabAction,
     PressKeyAction,
     RequestHumanInputAction,
     RunCommandAction,
+    ScreenshotAction,
     ScrollAction,
     StepHistoryEntry,
+    SwitchTabAction,
+    WaitAction,
 )
 from autobot.computer.computer import Computer
 from autobot.dom.extraction import DOMExtractionService
@@ -51,6 +61,44 @@ from autobot.prompts.builder import StepPromptBuilder, SystemPromptBuilder
 
 logger = logging.getLogger(__name__)
 
+# Pause between consecutive actions of one step, in seconds.
+_INTER_ACTION_DELAY = 0.3
+
+# Any RFC 3986 scheme ("HTTPS:", "ftp:", "mailto:", "about:", ...), matched
+# case-insensitively. A "host:port" prefix like "localhost:3000" is not a
+# scheme, so a colon followed only by digits doesn't count.
+_URL_SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.-]*:(?!\d+(?:[/?#]|$))", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _normalize_url(url: str) -> str:
+    """Give a scheme-less URL like "github.com" the https:// page.goto() requires.
+
+    Models routinely emit bare hosts; goto() rejects those outright as
+    invalid URLs, wasting the step. URLs that already have any scheme are
+    returned unchanged. Cached: an agent revisits the same few URLs.
+    """
+    url = url.strip()
+    if _URL_SCHEME_RE.match(url):
+        return url
+    return "https://" + url
+
+
+# run_command results are cut to 2000 characters, so only the head of each
+# stream is ever shown. Keeping 4 bytes per character (worst-case UTF-8) is
+# enough; everything past that is drained from the pipe and dropped instead of
+# buffered, so a command that prints megabytes doesn't sit in memory.
+_RUN_COMMAND_KEEP_BYTES = 2000 * 4
+
+
+async def _read_capped(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """Read a stream to EOF, keeping only its first `limit` bytes."""
+    kept = bytearray()
+    while chunk := await stream.read(65536):
+        if len(kept) < limit:
+            kept += chunk[: limit - len(kept)]
+    return bytes(kept)
+
 
 class LLMUnavailableError(RuntimeError):
     """The LLM failed repeatedly, so no further progress is possible.
@@ -83,6 +131,7 @@ class AgentLoop:
         use_vision: bool = True,
         custom_instructions: str | None = None,
         first_step_context: str | None = None,
+        computer: Computer | None = None,
     ):
         self.page = page
         self.llm_client = llm_client
@@ -98,6 +147,9 @@ class AgentLoop:
         # full mission picture once, here, so it doesn't eat context budget
         # every step.
         self.first_step_context = first_step_context
+        # URL and time of the last successful navigate — see _execute_navigate.
+        self._last_url: str | None = None
+        self._last_url_at: float = 0.0
 
         # State
         self.step_number = 0
@@ -113,7 +165,13 @@ class AgentLoop:
         # to False on entry, a cancel() that landed in that window would be
         # silently discarded — the exact bug this flag exists to prevent,
         # just moved earlier.
-        self.is_cancelled = False
+        #
+        # Backed by a threading.Event rather than a bare bool: cancel() is
+        # called from the dashboard's request thread, and blocking waits
+        # inside a step (the wait action) block on the event instead of a
+        # fixed sleep, so a cancel takes effect mid-wait instead of only
+        # once the current step finishes.
+        self._cancel_event = threading.Event()
         # If the LLM is unreachable (bad key, no credit, network down), every
         # step fails identically. Without a circuit breaker the agent silently
         # burns its ENTIRE step budget re-issuing a doomed request and then
@@ -143,8 +201,11 @@ class AgentLoop:
         # is worth its cost.
         self._sparse_dom_threshold = 5
 
-        # Computer API for OS-level tools
-        self.computer = Computer()
+        # Computer API for OS-level tools. Callers that run several loops
+        # back to back (MissionAgent) pass one in, so the tools — and any
+        # background processes the terminal tool is tracking — carry over
+        # between loops instead of being rebuilt for each.
+        self.computer = computer if computer is not None else Computer()
         self.env_memory = EnvironmentMemory()
         self.skill_distiller = SkillDistiller()
         self.approval_guard = ApprovalGuard()
@@ -180,6 +241,21 @@ class AgentLoop:
         logger.info(f"🔄 Mid-flight override received: '{new_instruction}'")
         self.pending_override = new_instruction
 
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @is_cancelled.setter
+    def is_cancelled(self, value: bool) -> None:
+        if value:
+            self._cancel_event.set()
+        else:
+            self._cancel_event.clear()
+
+    def cancel(self) -> None:
+        """Stop the loop before its next step and wake any in-progress wait."""
+        self._cancel_event.set()
+
     async def run(self) -> str:
         """
         Run the agent loop until completion or max_steps.
@@ -257,7 +333,7 @@ class AgentLoop:
         Returns:
             Result text if the agent called "done", None otherwise.
         """
-        step_start = time.time()
+        step_start = time.perf_counter()
 
         # Apply any mid-flight intervention overrides
         if self.pending_override:
@@ -332,7 +408,7 @@ class AgentLoop:
         )
         self.history.append(entry)
 
-        step_time = time.time() - step_start
+        step_time = time.perf_counter() - step_start
         logger.debug(f"Step {self.step_number + 1} completed in {step_time:.1f}s")
 
         # Check if agent called "done"
@@ -570,13 +646,21 @@ class AgentLoop:
                     )
                 break
 
-            # Small delay between actions to mimic human behavior
-            import asyncio
-            await asyncio.sleep(0.3)
+            # Small delay between actions to mimic human behavior (it also
+            # gives the page a moment to settle before the next observation).
+            # An explicit wait action has already paused, so only the
+            # shortfall is topped up; the two pauses coalesce into one.
+            delay = _INTER_ACTION_DELAY
+            if action.wait is not None:
+                delay = max(0.0, delay - action.wait.seconds)
+            if delay > 0:
+                await asyncio.sleep(delay)
 
         return results
 
-    async def _execute_computer_call(self, call_action: ComputerCallAction) -> ActionResult:
+    async def _execute_computer_call(
+        self, call_action: ComputerCallAction, browser_state: BrowserState
+    ) -> ActionResult:
         """
         Execute an OS-level tool call from the injected tool catalog.
 
@@ -620,10 +704,13 @@ class AgentLoop:
         AgentLoop can run without a browser (OS-only mode) — see
         AgentRunner.run — so every page access has to tolerate page=None.
         """
-        if self.page is None:
+        # Bound once: this runs several times per action (before/after URL
+        # comparisons), so read the attribute a single time.
+        page = self.page
+        if page is None:
             return ""
         try:
-            return self._page_url()
+            return page.url
         except Exception:
             return ""
 
@@ -633,6 +720,28 @@ class AgentLoop:
         "press_key", "switch_tab", "new_tab", "close_tab", "go_back",
     )
 
+    # action_name -> name of its handler(action_data, browser_state). Named
+    # rather than referenced so the table can sit next to the dispatch below
+    # the handlers it names; "done" is absent because _execute_actions
+    # records it without executing anything.
+    _ACTION_HANDLERS = {
+        "navigate": "_execute_navigate",
+        "click": "_execute_click",
+        "input_text": "_execute_input",
+        "scroll_down": "_execute_scroll_down",
+        "scroll_up": "_execute_scroll_up",
+        "press_key": "_execute_press_key",
+        "go_back": "_execute_go_back",
+        "new_tab": "_execute_new_tab",
+        "switch_tab": "_execute_switch_tab",
+        "close_tab": "_execute_close_tab",
+        "wait": "_execute_wait",
+        "screenshot": "_execute_screenshot",
+        "run_command": "_execute_run_command",
+        "request_human_input": "_execute_request_human_input",
+        "computer_call": "_execute_computer_call",
+    }
+
     async def _execute_single_action(
         self,
         action: ActionModel,
@@ -663,107 +772,145 @@ class AgentLoop:
                 ),
             )
 
+        # action_name is already resolved, so dispatch is one dict lookup
+        # instead of a None-check per action kind down a long elif chain.
+        handler_name = self._ACTION_HANDLERS.get(action_name)
         try:
-            if action.navigate is not None:
-                await self.page.goto(action.navigate.url, wait_until="domcontentloaded")
-                return ActionResult(action_name="navigate", success=True, page_changed=True)
-
-            elif action.click is not None:
-                return await self._execute_click(action.click, browser_state)
-
-            elif action.input_text is not None:
-                return await self._execute_input(action.input_text, browser_state)
-
-            elif action.scroll_down is not None:
-                await self.page.evaluate(
-                    f"window.scrollBy(0, {action.scroll_down.amount * 300})"
-                )
-                return ActionResult(action_name="scroll_down", success=True)
-
-            elif action.scroll_up is not None:
-                await self.page.evaluate(
-                    f"window.scrollBy(0, -{action.scroll_up.amount * 300})"
-                )
-                return ActionResult(action_name="scroll_up", success=True)
-
-            elif action.press_key is not None:
-                await self.page.keyboard.press(action.press_key.key)
-                return ActionResult(action_name="press_key", success=True)
-
-            elif action.go_back is not None:
-                await self.page.go_back()
-                return ActionResult(action_name="go_back", success=True, page_changed=True)
-
-            elif action.new_tab is not None:
-                new_page = await self.page.context.new_page()
-                if action.new_tab.url != "about:blank":
-                    await new_page.goto(action.new_tab.url, wait_until="domcontentloaded")
-                self.page = new_page  # Switch focus to new tab
-                return ActionResult(action_name="new_tab", success=True, page_changed=True)
-
-            elif action.switch_tab is not None:
-                for p in self.page.context.pages:
-                    if str(hash(p))[-6:] == action.switch_tab.tab_id:
-                        self.page = p
-                        await p.bring_to_front()
-                        return ActionResult(action_name="switch_tab", success=True, page_changed=True)
-                return ActionResult(
-                    action_name="switch_tab",
-                    success=False,
-                    error=f"Tab {action.switch_tab.tab_id} not found",
-                )
-
-            elif action.close_tab is not None:
-                await self.page.close()
-                pages = self.page.context.pages
-                if pages:
-                    self.page = pages[-1]
-                return ActionResult(action_name="close_tab", success=True, page_changed=True)
-
-            elif action.wait is not None:
-                import asyncio
-                await asyncio.sleep(action.wait.seconds)
-                return ActionResult(action_name="wait", success=True)
-
-            elif action.screenshot is not None:
-                return ActionResult(action_name="screenshot", success=True)
-
-            elif action.run_command is not None:
-                return await self._execute_run_command(action.run_command)
-
-            elif action.request_human_input is not None:
-                logger.info(f"❓ Human input requested: '{action.request_human_input.prompt}'")
-                return ActionResult(
-                    action_name="request_human_input",
-                    success=True,
-                    extracted_content=f"Human input requested: {action.request_human_input.prompt}",
-                )
-
-            elif action.computer_call is not None:
-                return await self._execute_computer_call(action.computer_call)
-
-            else:
-                # Tell the LLM exactly what it got wrong. Previously an
-                # unrecognized action name produced a bare "Unknown action:
-                # unknown", giving the model nothing to correct against — so
-                # it would often emit the same bad action again next step.
-                bad_keys = action.unrecognized_keys
-                if bad_keys:
-                    valid = ", ".join(n for n in action.model_fields)
-                    error = (
-                        f"Unrecognized action key(s): {', '.join(bad_keys)}. "
-                        f"Valid actions are: {valid}. "
-                        "To use an OS-level tool from the tool catalog, use "
-                        '{"computer_call": {"call": "computer.<module>.<method>(...)"}}'
-                    )
-                else:
-                    error = "Empty action — no action field was set."
-                return ActionResult(action_name="unknown", success=False, error=error)
-
+            if handler_name is None:
+                return self._unknown_action_result(action)
+            return await getattr(self, handler_name)(action_data, browser_state)
         except Exception as e:
             logger.error(f"Action {action_name} failed: {e}")
             return ActionResult(action_name=action_name, success=False, error=str(e))
 
+    @staticmethod
+    def _unknown_action_result(action: ActionModel) -> ActionResult:
+        """Failure result for an action with no recognized (or no) action key."""
+        # Tell the LLM exactly what it got wrong. Previously an
+        # unrecognized action name produced a bare "Unknown action:
+        # unknown", giving the model nothing to correct against — so
+        # it would often emit the same bad action again next step.
+        bad_keys = action.unrecognized_keys
+        if bad_keys:
+            valid = ", ".join(ACTION_NAMES)
+            error = (
+                f"Unrecognized action key(s): {', '.join(bad_keys)}. "
+                f"Valid actions are: {valid}. "
+                "To use an OS-level tool from the tool catalog, use "
+                '{"computer_call": {"call": "computer.<module>.<method>(...)"}}'
+            )
+        else:
+            error = "Empty action — no action field was set."
+        return ActionResult(action_name="unknown", success=False, error=error)
+
+    async def _execute_navigate(self, nav: NavigateAction, browser_state: BrowserState) -> ActionResult:
+        # Re-navigating to the page we just loaded is a full reload that
+        # throws away SPA state (open chats, editor cursor) and costs
+        # seconds of rendering, so a repeat within 2s is a no-op. Past
+        # that window it goes through: the model may be deliberately
+        # reloading a 404, a half-loaded SPA or an expired form.
+        target = _normalize_url(nav.url)
+        if (
+            self._last_url == target
+            and time.monotonic() - self._last_url_at < 2.0
+            and target.rstrip("/") == self._page_url().rstrip("/")
+        ):
+            return ActionResult(
+                action_name="navigate",
+                success=True,
+                extracted_content=f"Already on {target} — no navigation needed.",
+            )
+        await self.page.goto(target, wait_until=nav.wait_until)
+        self._last_url = target
+        self._last_url_at = time.monotonic()
+        return ActionResult(action_name="navigate", success=True, page_changed=True)
+
+    async def _execute_scroll_down(self, scroll: ScrollAction, browser_state: BrowserState) -> ActionResult:
+        await self.page.evaluate(f"window.scrollBy(0, {scroll.amount * 300})")
+        return ActionResult(action_name="scroll_down", success=True)
+
+    async def _execute_scroll_up(self, scroll: ScrollAction, browser_state: BrowserState) -> ActionResult:
+        await self.page.evaluate(f"window.scrollBy(0, -{scroll.amount * 300})")
+        return ActionResult(action_name="scroll_up", success=True)
+
+    async def _execute_press_key(self, press: PressKeyAction, browser_state: BrowserState) -> ActionResult:
+        await self.page.keyboard.press(press.key)
+        return ActionResult(action_name="press_key", success=True)
+
+    async def _execute_go_back(self, go_back: GoBackAction, browser_state: BrowserState) -> ActionResult:
+        # go_back() defaults to waiting for "load" — every image and
+        # subframe of a page we have already visited (often restored
+        # straight from the back/forward cache). The next step only
+        # needs the DOM, the same state navigate waits for by default.
+        await self.page.go_back(wait_until="domcontentloaded")
+        return ActionResult(action_name="go_back", success=True, page_changed=True)
+
+    async def _execute_new_tab(self, new_tab: NewTabAction, browser_state: BrowserState) -> ActionResult:
+        # A tab already showing this URL is reused rather than loading
+        # a duplicate — a second copy of an SPA (WhatsApp Web, Overleaf)
+        # is a full cold load, and some of them refuse to run twice.
+        # Normalized once and reused for the tab match, the goto and
+        # the result message.
+        url = _normalize_url(new_tab.url)
+        is_blank = url == "about:blank"
+        if not is_blank:
+            target = url.rstrip("/")
+            for p in self.page.context.pages:
+                if p.url.rstrip("/") == target:
+                    self.page = p
+                    await p.bring_to_front()
+                    return ActionResult(
+                        action_name="new_tab",
+                        success=True,
+                        page_changed=True,
+                        extracted_content=f"Switched to the tab already open on {url}.",
+                    )
+        new_page = await self.page.context.new_page()
+        if not is_blank:
+            await new_page.goto(url, wait_until=new_tab.wait_until)
+        self.page = new_page  # Switch focus to new tab
+        return ActionResult(action_name="new_tab", success=True, page_changed=True)
+
+    async def _execute_switch_tab(self, switch: SwitchTabAction, browser_state: BrowserState) -> ActionResult:
+        for p in self.page.context.pages:
+            if str(hash(p))[-6:] == switch.tab_id:
+                self.page = p
+                await p.bring_to_front()
+                return ActionResult(action_name="switch_tab", success=True, page_changed=True)
+        return ActionResult(
+            action_name="switch_tab",
+            success=False,
+            error=f"Tab {switch.tab_id} not found",
+        )
+
+    async def _execute_close_tab(self, close_tab: CloseTabAction, browser_state: BrowserState) -> ActionResult:
+        await self.page.close()
+        pages = self.page.context.pages
+        if pages:
+            self.page = pages[-1]
+        return ActionResult(action_name="close_tab", success=True, page_changed=True)
+
+    async def _execute_wait(self, wait: WaitAction, browser_state: BrowserState) -> ActionResult:
+        # Block on the cancel event rather than sleeping: a cancel()
+        # during a long wait returns immediately instead of after it.
+        cancelled = await asyncio.to_thread(self._cancel_event.wait, wait.seconds)
+        if cancelled:
+            return ActionResult(action_name="wait", success=False, error="Cancelled during wait")
+        return ActionResult(action_name="wait", success=True)
+
+    async def _execute_screenshot(self, screenshot: ScreenshotAction, browser_state: BrowserState) -> ActionResult:
+        return ActionResult(action_name="screenshot", success=True)
+
+    async def _execute_request_human_input(
+        self, request: RequestHumanInputAction, browser_state: BrowserState
+    ) -> ActionResult:
+        logger.info(f"❓ Human input requested: '{request.prompt}'")
+        return ActionResult(
+            action_name="request_human_input",
+            success=True,
+            extracted_content=f"Human input requested: {request.prompt}",
+        )
+
     async def _execute_click(self, click: ClickAction, browser_state: BrowserState) -> ActionResult:
         """
         Click an element by its DOM index via CDP (computer.browser.click_element).
@@ -922,13 +1069,22 @@ class AgentLoop:
             
         # --- Stall / Loop Detection ---
         if len(self.history) >= 3:
-            last_3 = self.history[-3:]
-            # Only compare the list of actions (dumping to JSON to easily match dicts)
-            acts_0 = [a.model_dump() for a in last_3[0].agent_output.action]
-            acts_1 = [a.model_dump() for a in last_3[1].agent_output.action]
-            acts_2 = [a.model_dump() for a in last_3[2].agent_output.action]
-            
-            if acts_0 == acts_1 == acts_2:
+            last_3 = [entry.agent_output.action for entry in self.history[-3:]]
+            # Only compare the list of actions (dumping to JSON to easily match
+            # dicts). Most steps differ already in which actions they took, so
+            # check the action names first and only deep-dump on a match —
+            # newest step first, each dump only if the previous one matched.
+            names = [[a.action_name for a in acts] for acts in last_3]
+            if names[0] == names[1] == names[2]:
+                acts_2 = [a.model_dump() for a in last_3[2]]
+                repeated = (
+                    acts_2 == [a.model_dump() for a in last_3[1]]
+                    and acts_2 == [a.model_dump() for a in last_3[0]]
+                )
+            else:
+                repeated = False
+
+            if repeated:
                 logger.warning(f"🔄 Loop detected: Agent repeated the exact same actions for 3 steps.")
                 lines.append(
                     "\n> [!CRITICAL WARNING]\n"
@@ -951,7 +1107,7 @@ class AgentLoop:
             f"Last steps:\n" + "\n".join(steps_text)
         )
 
-    async def _execute_run_command(self, cmd_action: RunCommandAction) -> ActionResult:
+    async def _execute_run_command(self, cmd_action: RunCommandAction, browser_state: BrowserState) -> ActionResult:
         """Execute a local shell command safely."""
         import asyncio
         from pathlib import Path
@@ -970,8 +1126,13 @@ class AgentLoop:
                 cwd=str(scratch_dir),
             )
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=float(cmd_action.timeout)
+                stdout, stderr, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_capped(process.stdout, _RUN_COMMAND_KEEP_BYTES),
+                        _read_capped(process.stderr, _RUN_COMMAND_KEEP_BYTES),
+                        process.wait(),
+                    ),
+                    timeout=float(cmd_action.timeout),
                 )
             except asyncio.TimeoutError:
                 process.kill()
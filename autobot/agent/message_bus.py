@@ -25,7 +25,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any, Callable, Coroutine
 
 logger = logging.getLogger(__name__)
@@ -51,8 +53,8 @@ class Message:
 
     def __post_init__(self):
         if not self.message_id:
-            import uuid
-            self.message_id = str(uuid.uuid4())[:8]
+            import secrets
+            self.message_id = secrets.token_hex(4)
 
     def to_dict(self) -> dict:
         return {
@@ -157,8 +159,10 @@ class MessageBus:
 
     def __init__(self) -> None:
         self._inboxes: dict[str, AgentInbox] = {}
-        self._history: list[Message] = []
+        # Bounded archive: once full, each send drops the oldest message in
+        # O(1) instead of re-slicing (copying) all 500 on every send.
         self._max_history = 500
+        self._history: deque[Message] = deque(maxlen=self._max_history)
         self.world_state = WorldState()
 
     def register(self, agent_id: str) -> AgentInbox:
@@ -180,8 +184,6 @@ class MessageBus:
         """
         # Archive in history
         self._history.append(msg)
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history:]
 
         if msg.to == "broadcast":
             for agent_id, inbox in self._inboxes.items():
@@ -205,10 +207,13 @@ class MessageBus:
         self, agent_id: str | None = None, limit: int = 20
     ) -> list[dict]:
         """Return recent message history, optionally filtered by agent."""
-        msgs = self._history
         if agent_id:
-            msgs = [m for m in msgs if m.from_id == agent_id or m.to in (agent_id, "broadcast")]
-        return [m.to_dict() for m in msgs[-limit:]]
+            msgs = [m for m in self._history if m.from_id == agent_id or m.to in (agent_id, "broadcast")]
+            return [m.to_dict() for m in msgs[-limit:]]
+        if limit <= 0:  # same slice semantics as before for non-positive limits
+            return [m.to_dict() for m in list(self._history)[-limit:]]
+        start = max(0, len(self._history) - limit)
+        return [m.to_dict() for m in islice(self._history, start, None)]
 
     def registered_agents(self) -> list[str]:
         return list(self._inboxes.keys())
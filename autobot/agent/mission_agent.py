@@ -57,6 +57,9 @@ class MissionAgent:
 
         # Track the current agent loop for status reporting
         self.current_agent_loop: AgentLoop | None = None
+        # Shared by every objective's AgentLoop (see AgentLoop.__init__);
+        # created on first use so a mission that fails planning never builds it.
+        self._computer: Any = None
         self._run_dir = None
 
     async def run(self) -> str:
@@ -102,6 +105,9 @@ class MissionAgent:
             # Run AgentLoop for this objective
             # Use planner-estimated step budget if available
             step_budget = objective.max_steps or self.max_steps_per_objective
+            if self._computer is None:
+                from autobot.computer.computer import Computer
+                self._computer = Computer()
             agent = AgentLoop(
                 page=self.page,
                 llm_client=self.llm_client,
@@ -110,6 +116,7 @@ class MissionAgent:
                 max_steps=step_budget,
                 custom_instructions=brief_context,
                 first_step_context=full_context,
+                computer=self._computer,
             )
             agent._run_dir = self._run_dir
             self.current_agent_loop = agent
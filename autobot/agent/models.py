@@ -22,9 +22,16 @@ from pydantic import BaseModel, ConfigDict, Field
 # Action Models
 # ─────────────────────────────────────────────
 
+# Default goto() readiness: return once the DOM is parsed instead of waiting
+# for every image, font and tracker ("load"). Interactivity is confirmed by
+# the next step's DOM snapshot anyway.
+PageWaitUntil = Literal["domcontentloaded", "load", "networkidle", "commit"]
+
+
 class NavigateAction(BaseModel):
     """Navigate to a URL."""
     url: str
+    wait_until: PageWaitUntil = "domcontentloaded"
 
 
 class ClickAction(BaseModel):
@@ -56,6 +63,7 @@ class SwitchTabAction(BaseModel):
 class NewTabAction(BaseModel):
     """Open a new tab."""
     url: str = "about:blank"
+    wait_until: PageWaitUntil = "domcontentloaded"
 
 
 class WaitAction(BaseModel):
@@ -151,7 +159,7 @@ class ActionModel(BaseModel):
     @property
     def action_name(self) -> str:
         """Get the name of the active action."""
-        for field_name in self.model_fields:
+        for field_name in ACTION_NAMES:
             if getattr(self, field_name) is not None:
                 return field_name
         return "unknown"
@@ -171,7 +179,7 @@ class ActionModel(BaseModel):
     @property
     def action_data(self) -> BaseModel | None:
         """Get the active action's data."""
-        for field_name in self.model_fields:
+        for field_name in ACTION_NAMES:
             val = getattr(self, field_name)
             if val is not None:
                 return val
@@ -184,9 +192,17 @@ class ActionModel(BaseModel):
         If True, remaining actions in the step should be skipped after execution.
         (Adapted from Browser Use's action category system.)
         """
-        return self.action_name in {
-            "navigate", "go_back", "switch_tab", "new_tab", "close_tab",
-        }
+        return self.action_name in _PAGE_CHANGING_ACTIONS
+
+
+# Every action key, in schema order. Resolved once at import: action_name /
+# action_data run several times per action, and the instance-level
+# model_fields lookup rebuilds nothing useful (and is deprecated on
+# instances in newer Pydantic releases).
+ACTION_NAMES: tuple[str, ...] = tuple(ActionModel.model_fields)
+_PAGE_CHANGING_ACTIONS = frozenset({
+    "navigate", "go_back", "switch_tab", "new_tab", "close_tab",
+})
 
 
 # ─────────────────────────────────────────────
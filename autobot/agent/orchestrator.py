@@ -418,7 +418,6 @@ Rules:
         Heuristic fallback: split goal by connectives.
         No LLM needed — pure string parsing.
         """
-        import uuid
         connectives = re.compile(
             r'\b(then|after that|and then|next|finally|step \d+)\b',
             re.IGNORECASE
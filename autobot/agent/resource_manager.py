@@ -45,7 +45,8 @@ class ScreenLock:
     Attributes:
         holder_id         : task_id currently holding the lock (or None)
         holder_goal       : short description of what the holder is doing
-        acquired_at       : epoch seconds when lock was last acquired
+        acquired_at       : time.monotonic() reading when lock was last acquired
+                            (only ever used for durations, so NTP steps can't skew it)
         last_released_by  : task_id that most recently released the lock
         context_switched  : True if the last acquire was by a different task
                             than the previous holder — caller should refocus window
@@ -122,7 +123,7 @@ class ScreenLock:
         waiter_entry = {
             "task_id": task_id,
             "goal": goal[:60],
-            "waiting_since": time.time(),
+            "waiting_since": time.monotonic(),
         }
         self._waiters.append(waiter_entry)
 
@@ -144,7 +145,7 @@ class ScreenLock:
 
         self.holder_id = task_id
         self.holder_goal = goal
-        self.acquired_at = time.time()
+        self.acquired_at = time.monotonic()
 
         if self.context_switched:
             logger.info(
@@ -171,17 +172,18 @@ class ScreenLock:
         return self._lock.locked()
 
     def get_status(self) -> dict:
+        now = time.monotonic()
         return {
             "locked": self.is_locked(),
             "holder_id": self.holder_id,
             "holder_goal": self.holder_goal,
-            "held_for_seconds": int(time.time() - self.acquired_at) if self.holder_id else 0,
+            "held_for_seconds": int(now - self.acquired_at) if self.holder_id else 0,
             "last_released_by": self.last_released_by,
             "waiting_tasks": [
                 {
                     "task_id": w["task_id"],
                     "goal": w["goal"],
-                    "waiting_seconds": int(time.time() - w["waiting_since"]),
+                    "waiting_seconds": int(now - w["waiting_since"]),
                 }
                 for w in self._waiters
             ],
@@ -284,9 +284,10 @@ class AgentRunner:
         """Cancel the running task."""
         self.status = "cancelled"
         if self._agent_loop:
-            # Set max_steps to 0 and is_cancelled to True to stop the current AgentLoop immediately
+            # Set max_steps to 0 and fire the cancel event to stop the current
+            # AgentLoop immediately, including mid-way through a wait action.
             self._agent_loop.max_steps = 0
-            self._agent_loop.is_cancelled = True
+            self._agent_loop.cancel()
         if self._mission_agent:
             # Also stop MissionAgent from advancing to the next objective
             from autobot.agent.mission import MissionStatus
@@ -307,10 +308,12 @@ class AgentRunner:
             "current_step": self.current_step,
             "max_steps": self.max_steps,
             "result": self.result[:500] if self.result else "",
+            # Slice before rendering — the dashboard polls this, and a long
+            # run would otherwise format every step just to keep five.
             "history": [
                 entry.to_history_text()
-                for entry in (self._agent_loop.history if self._agent_loop else [])
-            ][-5:],  # Last 5 steps
+                for entry in (self._agent_loop.history[-5:] if self._agent_loop else [])
+            ],  # Last 5 steps
         }
 
 
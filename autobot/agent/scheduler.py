@@ -30,8 +30,8 @@ import asyncio
 import json
 import logging
 import os
+import secrets
 import time
-import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -43,6 +43,12 @@ logger = logging.getLogger(__name__)
 # Where to persist the queue
 _QUEUE_FILE = Path(__file__).resolve().parent.parent.parent / "runs" / "queue.json"
 
+# Set once _QUEUE_FILE's directory is known to exist. _save_queue() runs on
+# every task state change, and re-issuing mkdir(parents=True) for a directory
+# that already exists is a stat (or several) per save for nothing. Cleared on
+# a failed save, so a directory removed at runtime gets recreated.
+_queue_dir_ready = False
+
 # Fields serialised to disk (excludes runtime-only fields like logs, current_step)
 _PERSIST_FIELDS = {
     "id", "goal", "status", "priority", "run_at",
@@ -148,14 +154,18 @@ class TaskScheduler:
 
     def _save_queue(self) -> None:
         """Write current tasks to disk. Called after every state change."""
+        global _queue_dir_ready
         try:
-            _QUEUE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            data = []
-            for task in self._tasks.values():
-                row = {k: v for k, v in task.model_dump().items() if k in _PERSIST_FIELDS}
-                data.append(row)
+            if not _queue_dir_ready:
+                _QUEUE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                _queue_dir_ready = True
+            # include= keeps pydantic from serialising the runtime-only fields
+            # (notably the up-to-_MAX_LOG_LINES log buffer) of every task on
+            # every state change, only for them to be filtered straight out.
+            data = [task.model_dump(include=_PERSIST_FIELDS) for task in self._tasks.values()]
             _QUEUE_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
         except Exception as e:
+            _queue_dir_ready = False
             logger.warning(f"Failed to save queue: {e}")
 
     def _load_queue(self) -> None:
@@ -216,14 +226,17 @@ class TaskScheduler:
 
         Returns the task_id so the caller can poll status or cancel.
         """
-        task_id = str(uuid.uuid4())[:8]
-        status = TaskStatus.SCHEDULED if run_at and run_at > time.time() else TaskStatus.QUEUED
+        task_id = secrets.token_hex(4)
+        # One clock read for both the scheduling decision and created_at.
+        now = time.time()
+        status = TaskStatus.SCHEDULED if run_at and run_at > now else TaskStatus.QUEUED
         task = ScheduledTask(
             id=task_id,
             goal=goal,
             status=status,
             priority=priority,
             run_at=run_at,
+            created_at=now,
         )
         async with self._lock:
             self._tasks[task_id] = task
@@ -459,7 +472,7 @@ class TaskScheduler:
         from autobot.agent.runner import AgentRunner  # late import avoids circular
 
         def _log(msg: str) -> None:
-            task.logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+            task.logs.append(f"[{time.strftime('%H:%M:%S')}] {msg}")
             if len(task.logs) > _MAX_LOG_LINES:
                 task.logs = task.logs[-_MAX_LOG_LINES:]
 
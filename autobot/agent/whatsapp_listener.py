@@ -10,6 +10,26 @@ from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
+# Message prefixes that mark a remote command; a tuple so one C-level
+# str.startswith() call checks them all.
+_COMMAND_PREFIXES = ("/autobot", "/override")
+
+# Both entry points gate on the page being WhatsApp Web and then target the
+# same chat DOM; hoisted so the checks share one literal each.
+_WHATSAPP_HOST = "web.whatsapp.com"
+_INCOMING_MESSAGE_SEL = "div.message-in span.selectable-text"
+_COMPOSE_BOX_SEL = 'div[contenteditable="true"][data-tab="10"]'
+
+# How many of the newest incoming messages each poll inspects.
+_RECENT_MESSAGES = 3
+
+# Returns the trimmed text of only the newest `n` incoming messages. A long
+# chat holds hundreds of bubbles; slicing in the page keeps the rest from
+# being serialized across CDP only to be thrown away in Python.
+_RECENT_MESSAGES_JS = """([sel, n]) => Array.from(
+    document.querySelectorAll(sel), (el) => el.textContent.trim()
+).slice(-n)"""
+
 
 class WhatsAppListener:
     """
@@ -34,16 +54,17 @@ class WhatsAppListener:
         if not self.page or self.page.is_closed():
             return []
 
-        if "web.whatsapp.com" not in self.page.url:
+        if _WHATSAPP_HOST not in self.page.url:
             return []
 
         new_commands: list[str] = []
         try:
             # Extract last message text from active chat stream
-            messages = await self.page.locator("div.message-in span.selectable-text").all_text_contents()
-            for msg in messages[-3:]:  # Check last 3 incoming messages
-                msg_text = msg.strip()
-                if msg_text.startswith("/autobot") or msg_text.startswith("/override"):
+            messages = await self.page.evaluate(
+                _RECENT_MESSAGES_JS, [_INCOMING_MESSAGE_SEL, _RECENT_MESSAGES]
+            )
+            for msg_text in messages:
+                if msg_text.startswith(_COMMAND_PREFIXES):
                     cmd = msg_text.split(" ", 1)[-1].strip()
                     new_commands.append(cmd)
                     if self.override_callback:
@@ -58,17 +79,20 @@ class WhatsAppListener:
         """
         Send an outbound progress update text message back to active WhatsApp chat.
         """
-        if not self.page or self.page.is_closed() or "web.whatsapp.com" not in self.page.url:
+        if not self.page or self.page.is_closed() or _WHATSAPP_HOST not in self.page.url:
             return False
 
         try:
-            input_box = self.page.locator('div[contenteditable="true"][data-tab="10"]')
-            if await input_box.count() > 0:
-                await input_box.first.click()
-                await input_box.first.fill(f"🤖 Autobot Status: {text}")
-                await self.page.keyboard.press("Enter")
-                logger.info(f"📤 Sent WhatsApp status update: '{text[:50]}'")
-                return True
+            # No count() pre-check: click() already waits for the box, and a
+            # missing one fails fast and lands in the except below. A locator
+            # rather than an element handle, since WhatsApp re-renders the
+            # compose box and fill() must re-resolve it after the click.
+            input_box = self.page.locator(_COMPOSE_BOX_SEL).first
+            await input_box.click(timeout=3000)
+            await input_box.fill(f"🤖 Autobot Status: {text}")
+            await self.page.keyboard.press("Enter")
+            logger.info(f"📤 Sent WhatsApp status update: '{text[:50]}'")
+            return True
         except Exception as e:
             logger.warning(f"Failed to send WhatsApp status update: {e}")
 
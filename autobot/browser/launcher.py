@@ -22,10 +22,12 @@ from __future__ import annotations
 
 import logging
 import os
+import platform
 import subprocess
 import time
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +47,19 @@ class AsyncBrowserLauncher:
         user_data_dir: str | None = None,
         profile_dir: str = "Default",
         headless: bool = False,
+        block_resources: frozenset[str] = frozenset(),
     ):
         self.debug_port = debug_port
         self.chrome_path = chrome_path or _detect_chrome()
         self.user_data_dir = user_data_dir or _default_user_data_dir()
         self.profile_dir = profile_dir
         self.headless = headless
+        # Playwright resource types (image, font, media, ...) to abort instead
+        # of downloading. Empty by default: this is the user's real Chrome,
+        # so blocking images would also blank out their own browsing and the
+        # agent's vision screenshots. Opt in via AUTOBOT_BROWSER_BLOCK_RESOURCES
+        # for text-only workloads where those bytes are pure overhead.
+        self.block_resources = block_resources
 
         self._chrome_process: subprocess.Popen | None = None
         self._playwright: Any = None
@@ -61,12 +70,9 @@ class AsyncBrowserLauncher:
     @classmethod
     def from_env(cls) -> "AsyncBrowserLauncher":
         """Create launcher from environment variables (same vars as old BrowserController)."""
-        return cls(
-            debug_port=int(os.getenv("AUTOBOT_CDP_PORT", "9222")),
-            chrome_path=os.getenv("AUTOBOT_CHROME_EXECUTABLE") or _detect_chrome(),
-            user_data_dir=os.getenv("AUTOBOT_CHROME_USER_DATA_DIR") or _real_chrome_user_data_dir(),
-            profile_dir=os.getenv("AUTOBOT_CHROME_PROFILE_DIR", "Default"),
-        )
+        # A fresh instance every time — it owns per-run process/page state —
+        # but the settings it's built from are resolved once per process.
+        return cls(**_env_launcher_kwargs())
 
     async def start(self) -> Any:
         """
@@ -85,6 +91,12 @@ class AsyncBrowserLauncher:
             browser that LOOKS logged in but fails auth unpredictably
             mid-task, which is worse than failing loudly up front.
         """
+        # Idempotent: a start() on a launcher that is still attached reuses the
+        # live connection instead of re-probing the debug port and starting a
+        # second Playwright driver, which would leak the first until stop().
+        if self._is_attached():
+            return self._page
+
         try:
             await self._launch_chrome()
             await self._connect_playwright()
@@ -112,9 +124,22 @@ class AsyncBrowserLauncher:
                     f"--profile-directory=\"{self.profile_dir}\"' and leave it open before running Autobot."
                 ) from retry_error
 
+    def _is_attached(self) -> bool:
+        """True while the Playwright connection and current page are both alive."""
+        if self._page is None or self._browser is None:
+            return False
+        try:
+            return self._browser.is_connected() and not self._page.is_closed()
+        except Exception:
+            return False
+
     async def _launch_chrome(self) -> None:
         """Launch Chrome with --remote-debugging-port."""
         if not self.chrome_path or not Path(self.chrome_path).exists():
+            # The memoized probes would keep answering "not found" for the
+            # rest of the process; forget them so the next from_env() sees a
+            # Chrome installed (or AUTOBOT_CHROME_EXECUTABLE fixed) meanwhile.
+            _invalidate_launcher_cache()
             raise RuntimeError(
                 f"Chrome not found at '{self.chrome_path}'. "
                 "Set AUTOBOT_CHROME_EXECUTABLE in .env or install Chrome."
@@ -175,11 +200,25 @@ class AsyncBrowserLauncher:
 
         logger.info(f"🌐 Launching Real Chrome Profile (dir: '{target_dir}')...")
 
+        # Fire-and-forget: all three stdio streams go to DEVNULL so no pipes
+        # are set up. On POSIX, close_fds=False lets CPython use posix_spawn()
+        # instead of fork+exec (Python's own fds are non-inheritable by
+        # default, so nothing leaks into Chrome). On Windows, Chrome gets its
+        # own process group, so a Ctrl+C in Autobot's console doesn't take
+        # the user's browser down with it.
+        if os.name == "nt":
+            spawn_opts: dict[str, Any] = {
+                "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS,
+            }
+        else:
+            spawn_opts = {"close_fds": False}
         try:
             self._chrome_process = subprocess.Popen(
                 args,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                **spawn_opts,
             )
         except Exception as e:
             raise RuntimeError(f"Failed to launch Chrome with profile '{target_dir}': {e}")
@@ -200,7 +239,13 @@ class AsyncBrowserLauncher:
         """Connect Playwright to Chrome via CDP."""
         from playwright.async_api import async_playwright
 
-        self._playwright = await async_playwright().start()
+        # The Playwright driver is its own process, and starting it costs far
+        # more than the CDP attach itself. Reconnects (ensure_page() after the
+        # browser went away, start()'s retry after a failed attach) reuse the
+        # driver this launcher already owns instead of spawning — and leaking —
+        # another one; only the browser connection is re-established.
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
 
         try:
             self._browser = await self._playwright.chromium.connect_over_cdp(
@@ -225,6 +270,16 @@ class AsyncBrowserLauncher:
             self._context = await self._browser.new_context()
             self._page = await self._context.new_page()
 
+        if self.block_resources:
+            await self._context.route("**/*", self._route_blocked)
+
+    async def _route_blocked(self, route: Any) -> None:
+        """Abort requests for the opted-out resource types; pass the rest through."""
+        if route.request.resource_type in self.block_resources:
+            await route.abort()
+        else:
+            await route.continue_()
+
     @staticmethod
     def _chrome_is_running() -> bool:
         """True if any chrome.exe process exists (Windows only)."""
@@ -308,22 +363,40 @@ class AsyncBrowserLauncher:
         return self._page
 
 
-def _detect_chrome() -> str | None:
-    """Detect Chrome executable path."""
-    paths = [
-        os.getenv("CHROME_EXECUTABLE"),
+# Standard Chrome install locations, per platform.system(). Only the current
+# platform's entries are probed — stat()ing Windows paths on Linux (and vice
+# versa) can only miss, and missing every candidate is exactly the
+# no-Chrome-installed case. diagnostics.check_chrome() reads the same table.
+_CHROME_CANDIDATES: dict[str, tuple[str, ...]] = {
+    "Windows": (
         r"C:\Program Files\Google\Chrome\Application\chrome.exe",
         r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-        "/usr/bin/google-chrome",
-        "/usr/bin/chromium-browser",
-    ]
-    for p in paths:
+    ),
+    "Darwin": ("/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",),
+    "Linux": ("/usr/bin/google-chrome", "/usr/bin/chromium-browser"),
+}
+
+
+def _chrome_candidates() -> tuple[str, ...]:
+    """This platform's standard Chrome paths (every platform's, if unrecognised)."""
+    found = _CHROME_CANDIDATES.get(platform.system())
+    if found is None:
+        found = tuple(p for paths in _CHROME_CANDIDATES.values() for p in paths)
+    return found
+
+
+# These depend only on the environment and what's installed, which
+# don't change while the process runs — probe the filesystem once.
+@cache
+def _detect_chrome() -> str | None:
+    """Detect Chrome executable path."""
+    for p in (os.getenv("CHROME_EXECUTABLE"), *_chrome_candidates()):
         if p and Path(p).exists():
             return p
     return None
 
 
+@cache
 def _default_user_data_dir() -> str:
     """Default user data dir for Autobot's Chrome profile."""
     local_app_data = os.getenv("LOCALAPPDATA", "")
@@ -332,6 +405,7 @@ def _default_user_data_dir() -> str:
     return str(Path.home() / ".autobot" / "chrome_profile")
 
 
+@cache
 def _real_chrome_user_data_dir() -> str | None:
     """Get the user's real Chrome user data directory."""
     local_app_data = os.getenv("LOCALAPPDATA", "")
@@ -349,6 +423,55 @@ def _real_chrome_user_data_dir() -> str | None:
     return None
 
 
+def _parse_block_resources(raw: str) -> frozenset[str]:
+    """'image, Font' -> frozenset({'image', 'font'})."""
+    return frozenset(t.strip().lower() for t in raw.split(",") if t.strip())
+
+
+# from_env() settings: (launcher kwarg, env var, fallback, parser). The
+# fallback applies when the var is unset or empty; a callable fallback is only
+# invoked then, so the filesystem probes behind _detect_chrome() and friends
+# are skipped when the user has set the var. The parser (None = keep the
+# string) turns the env value or a string fallback into the kwarg's type.
+_LAUNCHER_ENV_SPEC: tuple[tuple[str, str, str | Callable[[], Any], Callable[[str], Any] | None], ...] = (
+    ("debug_port", "AUTOBOT_CDP_PORT", "9222", int),
+    ("chrome_path", "AUTOBOT_CHROME_EXECUTABLE", _detect_chrome, None),
+    ("user_data_dir", "AUTOBOT_CHROME_USER_DATA_DIR", _real_chrome_user_data_dir, None),
+    ("profile_dir", "AUTOBOT_CHROME_PROFILE_DIR", "Default", None),
+    ("block_resources", "AUTOBOT_BROWSER_BLOCK_RESOURCES", "", _parse_block_resources),
+)
+
+
+@cache
+def _env_launcher_kwargs() -> dict[str, Any]:
+    """AsyncBrowserLauncher settings from the environment, read once.
+
+    Every AgentRunner builds its launcher via from_env(); the AUTOBOT_CHROME_*
+    vars and the profile-directory probes behind them don't change at
+    runtime (the dashboard's settings endpoint only touches LLM vars).
+    """
+    env = os.environ
+    kwargs: dict[str, Any] = {}
+    for name, var, fallback, parse in _LAUNCHER_ENV_SPEC:
+        raw = env.get(var) or fallback
+        if callable(raw):
+            kwargs[name] = raw()
+        else:
+            kwargs[name] = parse(raw) if parse else raw
+    return kwargs
+
+
+def _invalidate_launcher_cache() -> None:
+    """Forget the memoized Chrome path, profile dirs and from_env() settings.
+
+    Called when a launch finds no Chrome, so installing it or fixing the
+    AUTOBOT_CHROME_* / LOCALAPPDATA settings takes effect on the next run
+    without restarting the process.
+    """
+    for fn in (_env_launcher_kwargs, _detect_chrome, _default_user_data_dir, _real_chrome_user_data_dir):
+        fn.cache_clear()
+
+
 async def _async_sleep(seconds: float) -> None:
     """Async sleep helper."""
     import asyncio
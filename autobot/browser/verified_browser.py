@@ -40,6 +40,42 @@ def get_chrome_hwnd(profile_title_substring="Chrome"):
     win32gui.EnumWindows(enum_windows_callback, None)
     return found_hwnd
 
+def _chrome_window_titles():
+    """Titles of every visible Chrome-looking window (empty set without win32)."""
+    titles = set()
+    if not HAS_WIN32:
+        return titles
+
+    def enum_windows_callback(hwnd, extra):
+        if win32gui.IsWindowVisible(hwnd):
+            title = win32gui.GetWindowText(hwnd)
+            if "Chrome" in title or "Grok" in title or "Overleaf" in title:
+                titles.add(title)
+        return True
+
+    win32gui.EnumWindows(enum_windows_callback, None)
+    return titles
+
+
+def _wait_for_new_chrome_window(before, timeout=5.0, poll=0.25):
+    """Return as soon as a Chrome window title not in `before` shows up.
+
+    Launching — or opening a tab in an already-running Chrome — retitles a
+    window once the page starts loading, so this returns after however long
+    that actually takes instead of a fixed sleep. Without win32 there is
+    nothing to poll, so it simply waits out the timeout.
+    """
+    if not HAS_WIN32:
+        time.sleep(timeout)
+        return False
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if _chrome_window_titles() - before:
+            return True
+        time.sleep(poll)
+    return False
+
+
 def focus_and_maximize_chrome():
     """Ensure Chrome is strictly focused, brought to front, and maximized."""
     hwnd = get_chrome_hwnd()
@@ -71,8 +107,9 @@ def verified_launch(profile_dir="Default", url="https://grok.com"):
     """
     print(f"🚀 Launching Chrome (Profile: '{profile_dir}', URL: '{url}')...")
     cmd = f'start "" "{CHROME_EXE}" --profile-directory="{profile_dir}" "{url}"'
+    before = _chrome_window_titles()
     os.system(cmd)
-    time.sleep(5.0)
+    _wait_for_new_chrome_window(before, timeout=5.0)
 
     focus_and_maximize_chrome()
 
@@ -5,7 +5,6 @@ import logging
 import threading
 import time
 import random
-import pyautogui
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +54,13 @@ class AntiSleepManager:
     def move_mouse(self):
         """Perform a subtle mouse movement."""
         try:
+            # Imported on first use, not at module load: Computer() imports
+            # this module, and importing pyautogui opens a display connection
+            # (X11 on Linux) — a cost every agent start paid, and a hard
+            # ImportError for anyone without pyautogui, even if anti-sleep
+            # was never used.
+            import pyautogui
+
             x, y = pyautogui.position()
             # Move 1-2 pixels in a random direction and back
             dx = random.choice([-1, 1])
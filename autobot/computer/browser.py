@@ -17,12 +17,18 @@ Three-layer interaction priority:
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import json
 import logging
 import threading
 import time
 import urllib.request
-from typing import Any
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+if TYPE_CHECKING:
+    from autobot.dom.page_snapshot import CDPClient
 
 logger = logging.getLogger(__name__)
 
@@ -40,57 +46,133 @@ _INTERACTIVE_SEL = (
 _INTERACTIVE_SEL_JS = _INTERACTIVE_SEL.replace('"', '\\"')
 
 
+# Every Browser method used to pay for a fresh event loop (asyncio.run) and a
+# fresh WebSocket handshake to the tab, then tear both down — several of each
+# per agent step. Instead, all CDP work runs on one long-lived loop in a
+# daemon thread, which keeps one connection per tab open between calls.
+_cdp_loop: asyncio.AbstractEventLoop | None = None
+_cdp_loop_lock = threading.Lock()
+
+# Open tab connections, keyed by the tab's WebSocket URL. Only touched from
+# _cdp_loop's thread, so the dict itself needs no lock; the per-client
+# asyncio.Lock serialises commands, since two callers reading replies off one
+# socket at once would steal each other's responses.
+_POOL_MAX = 8
+_pool: dict[str, tuple["CDPClient", asyncio.Lock]] = {}
+
+
+def _get_cdp_loop() -> asyncio.AbstractEventLoop:
+    global _cdp_loop
+    with _cdp_loop_lock:
+        if _cdp_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True, name="autobot-cdp").start()
+            _cdp_loop = loop
+        return _cdp_loop
+
+
 def _run_sync(coro):
-    """Run an async coroutine from sync context.
+    """Run an async coroutine from sync context on the shared CDP loop.
 
-    Browser methods are dispatched via asyncio.to_thread(...) in the agent loop,
-    so we are in a worker thread with no running event loop — asyncio.run works.
-    If called from the main event loop thread, we fall back to a worker thread.
+    Browser methods are dispatched via asyncio.to_thread(...) in the agent
+    loop, so the caller is normally a worker thread and simply blocks on the
+    result. A caller on a thread with its own running loop gets the same 15s
+    cap the old one-off worker thread had, returning None on timeout.
     """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_cdp_loop())
     try:
-        running = asyncio.get_running_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
-        running = None
-    if running is None:
-        return asyncio.run(coro)
-
-    # We're on a thread that has a running loop — must not block it.
-    result: dict[str, Any] = {}
-    def _runner() -> None:
-        result["value"] = asyncio.run(coro)
-    t = threading.Thread(target=_runner, daemon=True)
-    t.start()
-    t.join(timeout=15)
-    return result.get("value")
-
-
-async def _cdp_eval(js: str, url_hint: str | None = None, timeout: float = 4.0) -> Any:
-    """Run a JS expression in the active tab via CDP. Returns the raw value or None."""
-    from autobot.dom.page_snapshot import _get_active_tab_ws_url, CDPClient
+        return future.result()
+    try:
+        return future.result(timeout=15)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        return None
+
+
+@asynccontextmanager
+async def _cdp_session(ws_url: str) -> AsyncIterator["CDPClient"]:
+    """Borrow the pooled connection to a tab, connecting on first use.
+
+    A command that raises or times out can leave the socket dead or with a
+    reply still in flight, so on any exception the connection is dropped
+    rather than handed to the next caller.
+    """
+    from autobot.dom.page_snapshot import CDPClient
+
+    entry = _pool.get(ws_url)
+    if entry is None:
+        stale_client = None
+        if len(_pool) >= _POOL_MAX:
+            # Oldest idle connection first — usually a tab that has since
+            # been closed. One that's mid-command is left alone.
+            stale_url = next((u for u, (_, lock) in _pool.items() if not lock.locked()), None)
+            if stale_url is not None:
+                stale_client, _ = _pool.pop(stale_url)
+        entry = _pool[ws_url] = (CDPClient(ws_url), asyncio.Lock())
+        # Closed only once the new entry is in place, so a caller that runs
+        # while this awaits finds it instead of creating a second one.
+        if stale_client is not None:
+            try:
+                await stale_client.close()
+            except Exception:
+                pass
+    client, lock = entry
+    async with lock:
+        try:
+            if not client.connected:
+                await asyncio.wait_for(client.connect(), timeout=2.0)
+            yield client
+        except BaseException:
+            if _pool.get(ws_url) is entry:
+                del _pool[ws_url]
+            try:
+                await client.close()
+            except Exception:
+                pass
+            raise
+
+
+async def _cdp_eval(
+    js: str, url_hint: str | None = None, timeout: float = 4.0, await_promise: bool = False
+) -> Any:
+    """Run a JS expression in the active tab via CDP. Returns the raw value or None.
+
+    With await_promise, a Promise result is awaited in the page and its
+    resolved value returned (None if it rejects).
+    """
+    from autobot.dom.page_snapshot import _get_active_tab_ws_url
     ws_url = await asyncio.wait_for(_get_active_tab_ws_url(url_hint=url_hint), timeout=1.5)
     if not ws_url:
         return None
-    client = CDPClient(ws_url)
-    await asyncio.wait_for(client.connect(), timeout=2.0)
-    try:
-        res = await asyncio.wait_for(
-            client.call("Runtime.evaluate", {
-                "expression": js,
-                "returnByValue": True,
-            }),
-            timeout=timeout,
-        )
-    finally:
-        await client.close()
+    params = {"expression": js, "returnByValue": True}
+    if await_promise:
+        params["awaitPromise"] = True
+    async with _cdp_session(ws_url) as client:
+        # call() gives up on its own at `timeout`; the outer wait_for is only a
+        # backstop for a stuck send, so it gets a little longer.
+        res = await asyncio.wait_for(client.call("Runtime.evaluate", params, timeout=timeout), timeout=timeout + 1.0)
     return res.get("result", {}).get("value")
 
 
+def _js_slice(max_chars: int | None) -> str:
+    """JS suffix that truncates a string in the page, before it crosses CDP."""
+    if max_chars is None:
+        return ""
+    return f".slice(0, {max(0, int(max_chars))})"
+
+
+@lru_cache(maxsize=256)
 def _js_find_by_index(index: int) -> str:
     """Return a JS expression that finds the nth interactive element (1-based).
 
     Uses the SAME selector and hidden-element filter as page_snapshot._JS_EXTRACT
     so the index here always matches the index shown in the DOM snapshot.
     Scrolls the element into view and returns current bounding-rect center coords.
+
+    Cached: the script depends only on the index, and the agent keeps hitting
+    the same handful of low indices, so each is formatted once.
     """
     sel = _INTERACTIVE_SEL_JS
     return f"""
@@ -124,10 +206,45 @@ def _js_find_by_index(index: int) -> str:
 """
 
 
+@lru_cache(maxsize=256)
+def _js_clear_by_index(index: int, is_input: bool) -> str:
+    """Return a JS expression that focuses and empties the nth interactive element.
+
+    Plain inputs/textareas get their value reset with input+change events;
+    contenteditable editors (ChatGPT, Grok, rich-text) are cleared with
+    selectAll+delete so the editor's own model sees the change. Cached like
+    _js_find_by_index — the script depends only on these two arguments.
+    """
+    if is_input:
+        clear = """
+    found.focus();
+    if (found.select) found.select();
+    found.value = '';
+    found.dispatchEvent(new Event('input', {bubbles:true}));
+    found.dispatchEvent(new Event('change', {bubbles:true}));"""
+    else:
+        clear = """
+    found.focus();
+    document.execCommand('selectAll');
+    document.execCommand('delete');"""
+    return f"""
+(function() {{
+    const SEL = "{_INTERACTIVE_SEL_JS}";
+    let idx = 1, found = null;
+    for (const el of document.querySelectorAll(SEL)) {{
+        const s = window.getComputedStyle(el);
+        if (s.display==='none'||s.visibility==='hidden'||s.opacity==='0') continue;
+        if (idx++==={index}) {{ found=el; break; }}
+    }}
+    if (!found) return 'not found';{clear}
+    return 'cleared';
+}})()"""
+
+
 class Browser:
     """CDP-backed text read / copy helpers for the active Chrome tab."""
 
-    def read(self, selector: str) -> str:
+    def read(self, selector: str, max_chars: int | None = None) -> str:
         """Return the innerText of the first element matching the CSS selector.
 
         Use this to capture AI chat responses, code blocks, or any element's text
@@ -135,12 +252,14 @@ class Browser:
             read('.message-content')           — Grok/ChatGPT response bubble
             read('[data-message-author-role="assistant"]')  — ChatGPT assistant messages
             read('main article')                — article body
+        Pass max_chars to cut long text inside the page, so only that much is
+        sent back over CDP (e.g. read('main', max_chars=2000) on a huge page).
         Returns an empty string if no element matches or CDP is unavailable.
         """
         js = (
             f"(function() {{"
             f"  var el = document.querySelector({json.dumps(selector)});"
-            f"  return el ? (el.innerText || el.textContent || '') : '';"
+            f"  return el ? (el.innerText || el.textContent || ''){_js_slice(max_chars)} : '';"
             f"}})()"
         )
         try:
@@ -150,16 +269,18 @@ class Browser:
             logger.warning(f"browser.read({selector!r}) failed: {e}")
             return ""
 
-    def read_all(self, selector: str, separator: str = "\n\n") -> str:
+    def read_all(self, selector: str, separator: str = "\n\n", max_chars: int | None = None) -> str:
         """Return the innerText of ALL matching elements joined by separator.
 
         Useful when an AI response is split across multiple message bubbles
         (e.g. ChatGPT's streaming output creates multiple DOM nodes).
+        max_chars caps the joined text in the page, as in read().
         """
         js = (
             f"(function() {{"
             f"  var els = document.querySelectorAll({json.dumps(selector)});"
-            f"  return Array.from(els).map(e => e.innerText || e.textContent || '').join({json.dumps(separator)});"
+            f"  return Array.from(els).map(e => e.innerText || e.textContent || '')"
+            f".join({json.dumps(separator)}){_js_slice(max_chars)};"
             f"}})()"
         )
         try:
@@ -169,6 +290,32 @@ class Browser:
             logger.warning(f"browser.read_all({selector!r}) failed: {e}")
             return ""
 
+    def read_many(self, selectors: list[str], max_chars: int | None = None) -> dict[str, str]:
+        """Return {selector: innerText of its first match} for several selectors at once.
+
+        One CDP round-trip for the whole list instead of one read() per
+        selector — use it when you need several fields from the same page
+        (e.g. a title, a price and a status badge). A selector with no match,
+        or that isn't valid CSS, maps to ''. max_chars caps each text, as in read().
+        """
+        js = (
+            f"(function() {{"
+            f"  return JSON.stringify({json.dumps(list(selectors))}.map(function(s) {{"
+            f"    var el; try {{ el = document.querySelector(s); }} catch (e) {{ return ''; }}"
+            f"    return el ? (el.innerText || el.textContent || ''){_js_slice(max_chars)} : '';"
+            f"  }}));"
+            f"}})()"
+        )
+        try:
+            val = _run_sync(_cdp_eval(js))
+            texts = json.loads(val) if val else []
+        except Exception as e:
+            logger.warning(f"browser.read_many({selectors!r}) failed: {e}")
+            texts = []
+        if len(texts) != len(selectors):
+            texts = [""] * len(selectors)
+        return dict(zip(selectors, texts))
+
     def copy(self, selector: str) -> str:
         """Read element text via CDP and write it to the system clipboard in one step.
 
@@ -232,14 +379,12 @@ class Browser:
         return _run_sync(self._click_element_async(index, url_hint)) or f"click_element({index}) failed"
 
     async def _click_element_async(self, index: int, url_hint: str | None = None) -> str:
-        from autobot.dom.page_snapshot import _get_active_tab_ws_url, CDPClient
+        from autobot.dom.page_snapshot import _get_active_tab_ws_url
         try:
             ws_url = await asyncio.wait_for(_get_active_tab_ws_url(url_hint=url_hint), timeout=1.5)
             if not ws_url:
                 return "CDP unavailable — Chrome not running with --remote-debugging-port=9222"
-            client = CDPClient(ws_url)
-            await asyncio.wait_for(client.connect(), timeout=2.0)
-            try:
+            async with _cdp_session(ws_url) as client:
                 # Find element and get current coordinates
                 res = await asyncio.wait_for(
                     client.call("Runtime.evaluate", {
@@ -263,19 +408,18 @@ class Browser:
                     "type": "mouseMoved", "x": cx, "y": cy, "button": "none", "clickCount": 0
                 })
                 await asyncio.sleep(0.05)
-                await client.call("Input.dispatchMouseEvent", {
-                    "type": "mousePressed", "x": cx, "y": cy, "button": "left", "clickCount": 1
-                })
-                await client.call("Input.dispatchMouseEvent", {
-                    "type": "mouseReleased", "x": cx, "y": cy, "button": "left", "clickCount": 1
-                })
+                await client.call_batch([
+                    ("Input.dispatchMouseEvent", {
+                        "type": "mousePressed", "x": cx, "y": cy, "button": "left", "clickCount": 1
+                    }),
+                    ("Input.dispatchMouseEvent", {
+                        "type": "mouseReleased", "x": cx, "y": cy, "button": "left", "clickCount": 1
+                    }),
+                ])
 
                 logger.info(f"browser.click_element({index}): clicked <{tag}> at ({cx},{cy})")
                 return f"clicked [{index}] <{tag}> at ({cx},{cy})"
 
-            finally:
-                await client.close()
-
         except Exception as e:
             logger.warning(f"browser.click_element({index}) failed: {e}")
             return f"error: {e}"
@@ -345,14 +489,12 @@ class Browser:
         return result or f"fill({index}) failed with no response"
 
     async def _fill_async(self, index: int, text: str, url_hint: str | None = None) -> str:
-        from autobot.dom.page_snapshot import _get_active_tab_ws_url, CDPClient
+        from autobot.dom.page_snapshot import _get_active_tab_ws_url
         try:
             ws_url = await asyncio.wait_for(_get_active_tab_ws_url(url_hint=url_hint), timeout=1.5)
             if not ws_url:
                 return "CDP unavailable"
-            client = CDPClient(ws_url)
-            await asyncio.wait_for(client.connect(), timeout=2.0)
-            try:
+            async with _cdp_session(ws_url) as client:
                 # Step 1: find element and scroll into view
                 find_res = await asyncio.wait_for(
                     client.call("Runtime.evaluate", {
@@ -374,54 +516,21 @@ class Browser:
                 tag = info.get("tag", "?")
 
                 # Step 2: click to focus
-                await client.call("Input.dispatchMouseEvent", {
-                    "type": "mouseMoved", "x": cx, "y": cy, "button": "none", "clickCount": 0
-                })
-                await client.call("Input.dispatchMouseEvent", {
-                    "type": "mousePressed", "x": cx, "y": cy, "button": "left", "clickCount": 1
-                })
-                await client.call("Input.dispatchMouseEvent", {
-                    "type": "mouseReleased", "x": cx, "y": cy, "button": "left", "clickCount": 1
-                })
+                await client.call_batch([
+                    ("Input.dispatchMouseEvent", {
+                        "type": "mouseMoved", "x": cx, "y": cy, "button": "none", "clickCount": 0
+                    }),
+                    ("Input.dispatchMouseEvent", {
+                        "type": "mousePressed", "x": cx, "y": cy, "button": "left", "clickCount": 1
+                    }),
+                    ("Input.dispatchMouseEvent", {
+                        "type": "mouseReleased", "x": cx, "y": cy, "button": "left", "clickCount": 1
+                    }),
+                ])
                 await asyncio.sleep(0.15)
 
                 # Step 3: clear existing content
-                if is_input:
-                    clear_js = f"""
-(function() {{
-    const SEL = "{_INTERACTIVE_SEL_JS}";
-    let idx = 1, found = null;
-    for (const el of document.querySelectorAll(SEL)) {{
-        const s = window.getComputedStyle(el);
-        if (s.display==='none'||s.visibility==='hidden'||s.opacity==='0') continue;
-        if (idx++==={index}) {{ found=el; break; }}
-    }}
-    if (!found) return 'not found';
-    found.focus();
-    if (found.select) found.select();
-    found.value = '';
-    found.dispatchEvent(new Event('input', {{bubbles:true}}));
-    found.dispatchEvent(new Event('change', {{bubbles:true}}));
-    return 'cleared';
-}})()"""
-                else:
-                    # contenteditable (ChatGPT, Grok, rich-text editors)
-                    clear_js = f"""
-(function() {{
-    const SEL = "{_INTERACTIVE_SEL_JS}";
-    let idx = 1, found = null;
-    for (const el of document.querySelectorAll(SEL)) {{
-        const s = window.getComputedStyle(el);
-        if (s.display==='none'||s.visibility==='hidden'||s.opacity==='0') continue;
-        if (idx++==={index}) {{ found=el; break; }}
-    }}
-    if (!found) return 'not found';
-    found.focus();
-    document.execCommand('selectAll');
-    document.execCommand('delete');
-    return 'cleared';
-}})()"""
-
+                clear_js = _js_clear_by_index(index, is_input)
                 await asyncio.wait_for(
                     client.call("Runtime.evaluate", {"expression": clear_js, "returnByValue": True}),
                     timeout=2.0,
@@ -456,9 +565,6 @@ class Browser:
                 logger.info(f"browser.fill({index}): typed {len(text)} chars into <{tag}>, verified={verified}")
                 return f"filled [{index}] <{tag}>: typed {len(text)} chars, verified: {verified} (actual: \"{preview}\")"
 
-            finally:
-                await client.close()
-
         except Exception as e:
             logger.warning(f"browser.fill({index}) failed: {e}")
             return f"error: {e}"
@@ -520,19 +626,37 @@ class Browser:
         Example: browser.wait_for('button.submit', 5.0)
         Example: browser.wait_for('[data-status="done"]', 30.0)
         """
-        js = f"""
-(function() {{
-    const el = document.querySelector({json.dumps(selector)});
-    if (!el) return false;
-    const s = window.getComputedStyle(el);
-    return s.display !== 'none' && s.visibility !== 'hidden';
-}})()"""
+        # The polling happens in the page: one evaluate whose promise settles
+        # as soon as the element shows up (checked every 100ms) or when the
+        # time runs out, instead of a CDP round-trip every 500ms from here.
+        # If navigation destroys the page mid-wait (the usual case after a
+        # form submit), the evaluate yields nothing and is re-issued against
+        # the new document for whatever time is left.
+        sel = json.dumps(selector)
         deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
+        while (remaining := deadline - time.monotonic()) > 0:
+            js = f"""
+new Promise((resolve) => {{
+    const visible = () => {{
+        const el = document.querySelector({sel});
+        if (!el) return false;
+        const s = window.getComputedStyle(el);
+        return s.display !== 'none' && s.visibility !== 'hidden';
+    }};
+    const deadline = Date.now() + {int(remaining * 1000)};
+    const tick = () => {{
+        if (visible()) return resolve(true);
+        if (Date.now() >= deadline) return resolve(false);
+        setTimeout(tick, 100);
+    }};
+    tick();
+}})"""
             try:
-                val = _run_sync(_cdp_eval(js, timeout=2.0))
-                if val:
+                val = _run_sync(_cdp_eval(js, timeout=remaining + 2.0, await_promise=True))
+                if val is True:
                     return True
+                if val is False:
+                    break
             except Exception:
                 pass
             time.sleep(0.5)
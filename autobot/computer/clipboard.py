@@ -8,9 +8,28 @@ from __future__ import annotations
 import logging
 import platform
 import time
+from functools import cache
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM = platform.system()  # fixed for the process; read once, not per clipboard call
+
+
+@cache
+def _pyperclip() -> Any:
+    """The pyperclip module, or None if it isn't installed — resolved once.
+
+    A failed import isn't cached by Python: retrying `import pyperclip` on
+    every get()/set() re-scanned sys.path each time before falling back to
+    spawning a clipboard tool. copy() alone polls get() up to six times.
+    """
+    try:
+        import pyperclip
+        return pyperclip
+    except ImportError:
+        return None
+
 
 class Clipboard:
     """Read and write the system clipboard."""
@@ -21,12 +40,10 @@ class Clipboard:
         Returns:
             The text currently in the clipboard.
         """
-        try:
-            import pyperclip
-            content = pyperclip.paste()
-        except ImportError:
-            content = self._fallback_get()
-        logger.debug(f"Clipboard get: '{content[:80]}...'" if len(content) > 80 else f"Clipboard get: '{content}'")
+        pyperclip = _pyperclip()
+        content = pyperclip.paste() if pyperclip is not None else self._fallback_get()
+        # Lengths only: the clipboard routinely holds passwords and tokens.
+        logger.debug(f"Clipboard get: {len(content)} chars")
         return content
 
     def set(self, text: str) -> None:
@@ -35,12 +52,12 @@ class Clipboard:
         Args:
             text: The text to copy to the clipboard.
         """
-        try:
-            import pyperclip
+        pyperclip = _pyperclip()
+        if pyperclip is not None:
             pyperclip.copy(text)
-        except ImportError:
+        else:
             self._fallback_set(text)
-        logger.debug(f"Clipboard set: '{text[:80]}...'" if len(text) > 80 else f"Clipboard set: '{text}'")
+        logger.debug(f"Clipboard set: {len(text)} chars")
 
     def copy(self) -> str:
         """Press Ctrl+C and return the clipboard contents.
@@ -159,7 +176,7 @@ class Clipboard:
     def _fallback_get(self) -> str:
         """Platform-specific fallback for reading clipboard."""
         import subprocess
-        system = platform.system()
+        system = _SYSTEM
         try:
             if system == "Linux":
                 result = subprocess.run(
@@ -192,7 +209,7 @@ class Clipboard:
     def _fallback_set(self, text: str) -> None:
         """Platform-specific fallback for writing clipboard."""
         import subprocess
-        system = platform.system()
+        system = _SYSTEM
         try:
             if system == "Linux":
                 proc = subprocess.Popen(
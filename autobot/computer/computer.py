@@ -57,6 +57,18 @@ if platform.system() == 'Windows':
         )
 
 
+# Attribute names of every tool submodule, in catalog order. Fixed at import
+# so _get_all_tools() doesn't rebuild the list each time it's called.
+_TOOL_NAMES: tuple[str, ...] = (
+    "mouse", "keyboard", "display", "clipboard", "browser",
+    "files", "terminal", "vault", "kaggle", "research", "anti_sleep",
+)
+_TOOL_NAMES_WITH_WINDOW: tuple[str, ...] = _TOOL_NAMES + ("window",)
+
+# (attribute name, tool class) pairs → rendered catalog; see get_tool_catalog().
+_catalog_cache: dict[tuple[tuple[str, type], ...], str] = {}
+
+
 class Computer:
     """
     Central computer control API.
@@ -100,10 +112,7 @@ class Computer:
         makes catalog names and dispatch resolution structurally unable to
         diverge again for any future tool.
         """
-        names = ["mouse", "keyboard", "display", "clipboard", "browser",
-                 "files", "terminal", "vault", "kaggle", "research", "anti_sleep"]
-        if hasattr(self, "window"):
-            names.append("window")
+        names = _TOOL_NAMES_WITH_WINDOW if hasattr(self, "window") else _TOOL_NAMES
         return [(name, getattr(self, name)) for name in names]
 
     def get_tool_catalog(self) -> str:
@@ -119,12 +128,24 @@ class Computer:
             computer.keyboard.type(text, interval=0.03) — Type text character by character.
             computer.display.screenshot() — Take a screenshot, returns base64 PNG.
             computer.clipboard.get() — Get clipboard contents.
+
+        The text depends only on which tool classes are mounted under which
+        names, never on instance state, so it is built once per combination
+        and shared by every Computer (each AgentLoop creates a fresh one).
         """
+        tools = self._get_all_tools()
+        key = tuple((name, type(tool)) for name, tool in tools)
+        catalog = _catalog_cache.get(key)
+        if catalog is None:
+            catalog = _catalog_cache[key] = self._build_tool_catalog(tools)
+        return catalog
+
+    def _build_tool_catalog(self, tools: list[tuple[str, Any]]) -> str:
         lines: list[str] = ["## OS Control Tools (via computer module)"]
         lines.append("These tools control the physical computer — use for OS-level tasks outside the browser.")
         lines.append("")
 
-        for tool_name, tool in self._get_all_tools():
+        for tool_name, tool in tools:
             tool_methods = self._extract_methods(tool, tool_name)
             for method_info in tool_methods:
                 lines.append(
@@ -41,6 +41,8 @@ import ast
 import asyncio
 import logging
 import re
+import weakref
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -59,6 +61,12 @@ SCREEN_MODULES = frozenset({"mouse", "keyboard", "display", "window", "browser"}
 _MAX_RESULT_CHARS = 2000
 
 
+# Resolved targets per live Computer, keyed by (module_name, method_name).
+# Each entry also remembers the owning module object so a sub-module that gets
+# swapped out (e.g. in tests) is re-resolved instead of served stale.
+_TARGET_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
 class DispatchError(Exception):
     """Raised when a call string is malformed or refers to something unavailable."""
 
@@ -96,10 +104,9 @@ def parse_computer_call(call_str: str) -> tuple[str | None, str, list, dict]:
     kwargs: dict = {}
     if args_str.strip():
         try:
-            tree = ast.parse(f"_f({args_str})", mode="eval")
+            call_node = _parse_call_args(args_str)
         except SyntaxError as e:
             raise DispatchError(f"could not parse arguments: {e}") from e
-        call_node = tree.body
         if not isinstance(call_node, ast.Call):
             raise DispatchError("arguments did not parse as a call")
         for node in call_node.args:
@@ -120,8 +127,46 @@ def parse_computer_call(call_str: str) -> tuple[str | None, str, list, dict]:
     return module_name, method_name, args, kwargs
 
 
+@lru_cache(maxsize=256)
+def _parse_call_args(args_str: str) -> ast.expr:
+    """Parse a call's argument text into an AST, once per distinct string.
+
+    Agents re-issue identical calls constantly (keyboard.press('enter'),
+    browser.read(...)), and parsing is the expensive half. The tree is only
+    ever read — literal_eval() builds fresh values from it on every call, so
+    no mutable argument is shared between calls. Syntax errors aren't cached.
+    """
+    return ast.parse(f"_f({args_str})", mode="eval").body
+
+
 def resolve_target(computer: Any, module_name: str | None, method_name: str) -> Any:
-    """Resolve the bound method on the live Computer instance, or raise DispatchError."""
+    """Resolve the bound method on the live Computer instance, or raise DispatchError.
+
+    Successful lookups are memoised per Computer, so a run that issues the same
+    call many times (keyboard.type, browser.read, ...) pays for the getattr
+    walk once. Failures are never cached — they raise every time.
+    """
+    if module_name is None:
+        # A top-level target is a method bound to the Computer itself; caching
+        # it under the Computer's own weak key would keep that key alive
+        # forever. It is a single getattr anyway.
+        return _resolve_target_uncached(computer, module_name, method_name)
+    owner = getattr(computer, module_name, None)
+    try:
+        per_computer = _TARGET_CACHE.setdefault(computer, {})
+    except TypeError:  # not weak-referenceable — just resolve directly
+        return _resolve_target_uncached(computer, module_name, method_name)
+
+    key = (module_name, method_name)
+    cached = per_computer.get(key)
+    if cached is not None and cached[0] is owner:
+        return cached[1]
+    target = _resolve_target_uncached(computer, module_name, method_name)
+    per_computer[key] = (owner, target)
+    return target
+
+
+def _resolve_target_uncached(computer: Any, module_name: str | None, method_name: str) -> Any:
     if module_name is None:
         target = getattr(computer, method_name, None)
         if target is None or not callable(target):
@@ -200,6 +245,9 @@ def _format_result(call_str: str, result: Any) -> str:
     if result is None:
         return f"OK: {call_str}"
     text = str(result)
-    if len(text) > _MAX_RESULT_CHARS:
-        text = text[:_MAX_RESULT_CHARS] + f"... [truncated, {len(str(result))} chars total]"
+    # Measure the string we already have — re-running str(result) for the
+    # total would render a large result (file contents, page text) twice.
+    total = len(text)
+    if total > _MAX_RESULT_CHARS:
+        text = text[:_MAX_RESULT_CHARS] + f"... [truncated, {total} chars total]"
     return text
@@ -8,9 +8,17 @@ from __future__ import annotations
 
 import base64
 import logging
+import platform
+import socket
+import time
 
 logger = logging.getLogger(__name__)
 
+# Neither changes while the process runs, so both are resolved once at import
+# instead of on every windows() / window_titles() / focus() call.
+_SYSTEM = platform.system()
+_HOSTNAME = socket.gethostname()
+
 
 class Display:
     """Capture screenshots and get screen information."""
@@ -86,10 +94,9 @@ class Display:
         Returns:
             Formatted list of open windows, or a screenshot-based fallback.
         """
-        import platform
         import subprocess
 
-        system = platform.system()
+        system = _SYSTEM
         try:
             if system == "Linux":
                 # wmctrl -l lists: id  desktop  host  title
@@ -102,9 +109,7 @@ class Display:
                         parts = line.split(None, 3)
                         title = parts[3] if len(parts) > 3 else "(no title)"
                         # Strip the hostname from the title
-                        import socket
-                        hostname = socket.gethostname()
-                        title = title.replace(hostname, "").strip()
+                        title = title.replace(_HOSTNAME, "").strip()
                         if title and title not in ("Desktop",):
                             lines.append(f"  • {title}")
                     return "\n".join(lines) if len(lines) > 1 else "No windows open."
@@ -148,11 +153,9 @@ class Display:
         Returns an empty frozenset if wmctrl is unavailable (non-Linux or not installed).
         Each call takes ~5-10ms — negligible for per-action checks.
         """
-        import platform
         import subprocess
-        import socket
 
-        if platform.system() != "Linux":
+        if _SYSTEM != "Linux":
             return frozenset()
         try:
             result = subprocess.run(
@@ -160,12 +163,11 @@ class Display:
             )
             if result.returncode != 0:
                 return frozenset()
-            hostname = socket.gethostname()
             titles: set[str] = set()
             for line in result.stdout.strip().splitlines():
                 parts = line.split(None, 3)
                 if len(parts) > 3:
-                    title = parts[3].replace(hostname, "").strip()
+                    title = parts[3].replace(_HOSTNAME, "").strip()
                     if title and title not in ("Desktop",):
                         titles.add(title)
             return frozenset(titles)
@@ -183,25 +185,26 @@ class Display:
         Returns:
             Status string confirming which window was focused.
         """
-        import platform
         import subprocess
 
-        system = platform.system()
+        system = _SYSTEM
         try:
             if system == "Linux":
                 result = subprocess.run(
                     ["wmctrl", "-a", window_title],
                     capture_output=True, text=True, timeout=3,
                 )
-                import time; time.sleep(0.3)
                 if result.returncode == 0:
+                    # Only a window that actually got focus needs time to
+                    # settle; a failed lookup has nothing to wait for.
+                    time.sleep(0.3)
                     return f"Focused window matching: '{window_title}'"
                 return f"No window found matching: '{window_title}'. Use display.windows() to see what's open."
 
             elif system == "Darwin":
                 script = f'tell application "{window_title}" to activate'
                 subprocess.run(["osascript", "-e", script], timeout=3)
-                import time; time.sleep(0.3)
+                time.sleep(0.3)
                 return f"Activated: {window_title}"
 
         except Exception as e:
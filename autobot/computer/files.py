@@ -12,6 +12,7 @@ Usage (agent computer_call):
 """
 from __future__ import annotations
 
+import fnmatch
 import logging
 import os
 from datetime import datetime
@@ -22,6 +23,15 @@ logger = logging.getLogger(__name__)
 _MAX_READ_BYTES = 32_000   # ~8k tokens — enough for most files
 _MAX_LIST_ENTRIES = 100
 
+# Directories search() never descends into: version-control internals,
+# dependency/virtualenv trees and browser caches. Under "~" these hold tens of
+# thousands of files that are never what the agent is looking for, and
+# walking them dominated search time.
+_SEARCH_SKIP_DIRS = frozenset({
+    ".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv",
+    ".mypy_cache", ".pytest_cache", "Cache", "Code Cache", "GPUCache",
+})
+
 
 class Files:
     """
@@ -134,16 +144,14 @@ class Files:
             if not root.exists():
                 return f"Directory not found: {root}"
             matches = []
-            for match in root.rglob(name):
-                if match.name.startswith("."):
-                    continue  # skip hidden
+            for entry, is_dir in _scan_matches(str(root), name):
                 try:
-                    stat = match.stat()
+                    stat = entry.stat()
                     mtime = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-                    size = _fmt_size(stat.st_size) if match.is_file() else "dir"
-                    matches.append((mtime, f"  {match}  ({size})  {mtime}"))
+                    size = "dir" if is_dir else _fmt_size(stat.st_size)
+                    matches.append((mtime, f"  {entry.path}  ({size})  {mtime}"))
                 except Exception:
-                    matches.append(("", f"  {match}"))
+                    matches.append(("", f"  {entry.path}"))
                 if len(matches) >= max_results:
                     break
             if not matches:
@@ -239,6 +247,32 @@ def _fmt_size(size: int) -> str:
     return f"{size}GB"
 
 
+def _scan_matches(root: str, pattern: str):
+    """Yield (DirEntry, is_dir) for non-hidden entries under root matching pattern.
+
+    An os.scandir walk rather than Path.rglob: DirEntry carries the file type
+    from the directory listing (no extra is_file() syscall per match, and
+    stat() is served from the listing on Windows), and _SEARCH_SKIP_DIRS are
+    pruned instead of walked. Symlinked directories are not followed.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if not entry.name.startswith(".") and fnmatch.fnmatch(entry.name, pattern):
+                    yield entry, is_dir
+                if is_dir and entry.name not in _SEARCH_SKIP_DIRS:
+                    stack.append(entry.path)
+
+
 def _read_lines(p: Path, max_lines: int) -> str:
     try:
         with open(p, encoding="utf-8", errors="replace") as f:
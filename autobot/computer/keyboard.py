@@ -8,49 +8,97 @@ from __future__ import annotations
 
 import logging
 import time
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Without xdotool (i.e. on Windows) typing falls to pyautogui, one key event
+# per character plus the interval sleep — and it can't type non-ASCII at all.
+# Past this length, or for any non-ASCII text, paste through the clipboard
+# instead — unless the text is secret: clipboard managers keep a history, so
+# passwords and tokens are always typed key by key.
+_PASTE_MIN_CHARS = 100
+
+
+def _xdotool(*args: str, timeout: float) -> None:
+    """Run one xdotool command, discarding its output.
+
+    press() runs this for every key. Output was captured into two fresh pipes
+    per call and never read; sending it to DEVNULL skips that setup, and
+    close_fds=False lets CPython spawn via posix_spawn() instead of
+    fork+exec. Raises like subprocess.run (FileNotFoundError when xdotool is
+    missing, TimeoutExpired), which callers use to pick their fallback.
+    """
+    import subprocess
+    subprocess.run(
+        ["xdotool", *args],
+        timeout=timeout,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,
+    )
+
 
 class Keyboard:
     """Control the keyboard at the OS level."""
 
-    def type(self, text: str, interval: float = 0.03) -> None:
+    def type(self, text: str, interval: float = 0.03, secret: bool = False) -> None:
         """Type text character by character. Supports all characters including Unicode and special chars.
 
         Args:
             text: The text to type.
             interval: Delay between each character in seconds.
+            secret: Set for passwords/tokens — never routed through the clipboard or logged.
         """
         import subprocess
         # Clamp timeout: 5s minimum, 30s maximum regardless of text length
         _timeout = max(5, min(30, len(text) // 20 + 5))
         try:
             # xdotool handles all characters reliably (URLs, Unicode, special chars)
-            subprocess.run(
-                ["xdotool", "type", "--clearmodifiers", "--delay",
-                 str(int(interval * 1000)), text],
-                timeout=_timeout,
-                capture_output=True,
-            )
+            _xdotool("type", "--clearmodifiers", "--delay", str(int(interval * 1000)), text,
+                     timeout=_timeout)
         except subprocess.TimeoutExpired:
             # Text too long for one shot — type in 200-char chunks
             logger.debug(f"xdotool type timed out, chunking {len(text)} chars")
             for _chunk in [text[i:i+200] for i in range(0, len(text), 200)]:
-                subprocess.run(
-                    ["xdotool", "type", "--clearmodifiers", "--delay",
-                     str(int(interval * 1000)), _chunk],
-                    timeout=15,
-                    capture_output=True,
-                )
+                _xdotool("type", "--clearmodifiers", "--delay", str(int(interval * 1000)), _chunk,
+                         timeout=15)
         except FileNotFoundError:
-            # xdotool not installed — last resort pyautogui (ASCII only)
+            # xdotool not installed — last resort pyautogui (ASCII only),
+            # or a clipboard paste for long / non-ASCII text.
             logger.warning("xdotool not found — falling back to pyautogui (Unicode may not work)")
             import pyautogui
-            pyautogui.typewrite(text, interval=interval)
+            if not secret and (len(text) >= _PASTE_MIN_CHARS or not text.isascii()):
+                self._paste(text)
+            else:
+                pyautogui.typewrite(text, interval=interval)
         except Exception as e:
             logger.warning(f"xdotool type failed: {e}")
-        logger.debug(f"Keyboard type: '{text[:50]}...'")
+        logger.debug(f"Keyboard type: {len(text)} chars" if secret else f"Keyboard type: '{text[:50]}...'")
+
+    def _paste(self, text: str) -> None:
+        """Insert text with one paste (Cmd+V on macOS, Ctrl+V elsewhere),
+        leaving the user's clipboard as it was.
+
+        The previous contents are only put back when they could be read as
+        text: an empty read also covers images and files on the clipboard,
+        which writing "" back would destroy.
+        """
+        import pyautogui
+        from autobot.computer.clipboard import _SYSTEM, Clipboard
+        clipboard = Clipboard()
+        try:
+            saved = clipboard.get()
+        except Exception:
+            saved = None
+        clipboard.set(text)
+        pyautogui.hotkey("command" if _SYSTEM == "Darwin" else "ctrl", "v")
+        # The target app reads the clipboard asynchronously; restoring it
+        # immediately can make it paste the old contents instead.
+        time.sleep(0.2)
+        if saved:
+            clipboard.set(saved)
 
     def write(self, text: str) -> None:
         """Type text using the write method (supports Unicode).
@@ -98,36 +146,38 @@ class Keyboard:
         Uses xdotool for reliability — works even when the browser window is not
         the last-focused window, as xdotool sends events at the OS level.
         """
-        import subprocess, time
-        # Normalise to lowercase for mapping lookups
-        if "+" in key:
-            parts = [self._KEY_MAP.get(k.strip(), k.strip().lower()) for k in key.split("+")]
-            xdotool_parts = [self._XDOTOOL_KEY_MAP.get(p, p) for p in parts]
-            xdotool_key = "+".join(xdotool_parts)
-        else:
-            mapped = self._KEY_MAP.get(key, key.lower())
-            xdotool_key = self._XDOTOOL_KEY_MAP.get(mapped, mapped)
+        parts, xdotool_key = self._parse_key(key)
 
         try:
-            subprocess.run(
-                ["xdotool", "key", "--clearmodifiers", xdotool_key],
-                timeout=5,
-                capture_output=True,
-            )
+            _xdotool("key", "--clearmodifiers", xdotool_key, timeout=5)
             logger.debug(f"Keyboard press (xdotool): {key} → {xdotool_key}")
             return
         except (FileNotFoundError, Exception) as e:
             logger.debug(f"xdotool key failed ({e}), falling back to pyautogui")
 
         import pyautogui
-        if "+" in key:
-            parts = [self._KEY_MAP.get(k.strip(), k.strip().lower()) for k in key.split("+")]
+        if len(parts) > 1:
             pyautogui.hotkey(*parts)
         else:
-            mapped = self._KEY_MAP.get(key, key.lower())
-            pyautogui.press(mapped)
+            pyautogui.press(parts[0])
         logger.debug(f"Keyboard press (pyautogui): {key}")
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _parse_key(cls, key: str) -> tuple[tuple[str, ...], str]:
+        """Translate a key or combo once into (pyautogui parts, xdotool key).
+
+        The agent presses the same handful of keys ('Enter', 'ctrl+a', 'Tab')
+        over and over; caching the split/strip/map work means press() does it
+        once per distinct key string instead of once per path per call.
+        """
+        if "+" in key:
+            parts = tuple(cls._KEY_MAP.get(k.strip(), k.strip().lower()) for k in key.split("+"))
+        else:
+            parts = (cls._KEY_MAP.get(key, key.lower()),)
+        xdotool_key = "+".join(cls._XDOTOOL_KEY_MAP.get(p, p) for p in parts)
+        return parts, xdotool_key
+
     def hotkey(self, *keys: str) -> None:
         """Press a keyboard shortcut (multiple keys simultaneously).
 
@@ -155,12 +155,23 @@ class Vault:
 
     def __init__(self, path: Path | None = None) -> None:
         self._path = path or _VAULT_PATH
-        self._fernet = _get_fernet()
-        if self._fernet is None:
-            logger.warning(
-                "cryptography package not installed — vault uses base64 obfuscation. "
-                "Run: pip install cryptography  for proper encryption."
-            )
+        # Built on first store()/get(): every Computer() constructs a Vault,
+        # but most runs never touch a credential, so they shouldn't pay for
+        # importing cryptography, creating the salt file, or (on macOS)
+        # spawning ioreg to read the machine ID.
+        self._fernet = None
+        self._fernet_ready = False
+
+    def _cipher(self):
+        if not self._fernet_ready:
+            self._fernet = _get_fernet()
+            self._fernet_ready = True
+            if self._fernet is None:
+                logger.warning(
+                    "cryptography package not installed — vault uses base64 obfuscation. "
+                    "Run: pip install cryptography  for proper encryption."
+                )
+        return self._fernet
 
     def _load(self) -> dict[str, str]:
         try:
@@ -190,7 +201,7 @@ class Vault:
         """
         name = name.strip().lower().replace(" ", "_")
         data = self._load()
-        data[name] = _encrypt(value, self._fernet)
+        data[name] = _encrypt(value, self._cipher())
         self._save(data)
         logger.info(f"🔐 Vault: stored '{name}'")
         return f"Stored '{name}' in vault."
@@ -200,14 +211,15 @@ class Vault:
         Retrieve a credential by name.
 
         Returns the plaintext value, or None if not found.
-        When using in a task: type the result directly with computer.keyboard.type().
+        When using in a task: type the result directly with
+        computer.keyboard.type(value, secret=True) so it never touches the clipboard.
         """
         name = name.strip().lower().replace(" ", "_")
         data = self._load()
         if name not in data:
             return None
         try:
-            return _decrypt(data[name], self._fernet)
+            return _decrypt(data[name], self._cipher())
         except Exception as e:
             logger.warning(f"Vault decrypt failed for '{name}': {e}")
             return None
@@ -16,9 +16,16 @@ from autobot.dom.native_extraction import NativeExtractionService
 
 logger = logging.getLogger(__name__)
 
-# Threads that have already had COM initialized, so we only pay for it once each.
-_com_ready: set[int] = set()
-_com_lock = threading.Lock()
+class _ComState(threading.local):
+    # Class-level default, so a thread that has never initialized COM reads
+    # False without a getattr() fallback.
+    ready = False
+
+
+# Per-thread "COM is initialized" flag, so we only pay for it once each. Being
+# thread-local it needs no lock, and the check on every call is one attribute
+# load rather than get_ident() + a locked set lookup.
+_com_state = _ComState()
 
 
 def _ensure_com_initialized() -> None:
@@ -36,9 +43,9 @@ def _ensure_com_initialized() -> None:
     are reused across many calls, so initializing once per thread and leaving
     it is both correct and cheaper than bracketing every call.
     """
-    tid = threading.get_ident()
-    if tid in _com_ready:
+    if _com_state.ready:
         return
+    tid = threading.get_ident()
     try:
         import comtypes
         # STA (apartment-threaded) is what UI Automation expects.
@@ -49,15 +56,15 @@ def _ensure_com_initialized() -> None:
         logger.debug(f"CoInitialize on thread {tid}: {e}")
     except Exception as e:
         logger.debug(f"CoInitialize unavailable on thread {tid}: {e}")
-    with _com_lock:
-        _com_ready.add(tid)
+    _com_state.ready = True
 
 
 def _needs_com(func: Callable) -> Callable:
     """Ensure COM is live on this thread before touching UI Automation."""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        _ensure_com_initialized()
+        if not _com_state.ready:
+            _ensure_com_initialized()
         return func(*args, **kwargs)
     return wrapper
 
@@ -145,7 +152,10 @@ class Window:
                     control.GetValuePattern().SetValue(text)
                 else:
                     control.SetFocus()
-                    self.keyboard.type(text)
+                    # The control already has focus, so there's nothing to
+                    # pace against — the default 30 ms per-character delay
+                    # only adds ~6 s to a 200-char string.
+                    self.keyboard.type(text, interval=0)
                 return True
             except Exception as e:
                 logger.warning(f"Native type into [{index}] failed: {e}")
@@ -126,8 +126,8 @@ def check_optional_packages() -> list[Check]:
     else:
         checks.append(Check(
             "mouse/keyboard control (pyautogui)", FAIL,
-            "not installed - anti_sleep imports it at module load, which "
-            "breaks Computer() and therefore the whole agent",
+            "not installed - mouse, keyboard and anti-sleep calls will fail "
+            "when the agent uses them",
             "pip install pyautogui",
         ))
     return checks
@@ -135,14 +135,12 @@ def check_optional_packages() -> list[Check]:
 
 def check_chrome() -> Check:
     """Locate the Chrome executable the launcher will try to start."""
+    from autobot.browser.launcher import _chrome_candidates
+
     candidates = [
         os.getenv("AUTOBOT_CHROME_EXECUTABLE"),
         os.getenv("CHROME_EXECUTABLE"),
-        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-        "/usr/bin/google-chrome",
-        "/usr/bin/chromium-browser",
+        *_chrome_candidates(),
     ]
     for path in candidates:
         if path and Path(path).exists():
@@ -341,18 +339,21 @@ def check_proxy_env() -> list[Check]:
     return checks
 
 
+_APPROVAL_MODE_NOTES = {
+    "strict": "pauses for CAUTION and above",
+    "balanced": "pauses for DANGER and above",
+    "trusted": "pauses only for IRREVERSIBLE actions",
+}
+
+
 def check_approval_mode() -> Check:
     mode = os.getenv("AUTOBOT_APPROVAL_MODE", "balanced").lower()
-    if mode not in ("strict", "balanced", "trusted"):
+    note = _APPROVAL_MODE_NOTES.get(mode)
+    if note is None:
         return Check(
             "approval mode", FAIL, f"unrecognized value '{mode}'",
             "Set AUTOBOT_APPROVAL_MODE to strict, balanced, or trusted.",
         )
-    note = {
-        "strict": "pauses for CAUTION and above",
-        "balanced": "pauses for DANGER and above",
-        "trusted": "pauses only for IRREVERSIBLE actions",
-    }[mode]
     return Check("approval mode", OK, f"{mode} - {note}")
 
 
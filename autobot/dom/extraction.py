@@ -25,6 +25,7 @@ Usage:
 """
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 from typing import Any
@@ -36,7 +37,7 @@ from autobot.dom.models import (
     SelectorMap,
     TabInfo,
 )
-from autobot.dom.page_snapshot import get_page_snapshot
+from autobot.dom.page_snapshot import _get_tab_titles_sync, get_page_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -85,10 +86,12 @@ class DOMExtractionService:
         if snapshot is None:
             return self._empty_state(url_hint)
 
+        # A live keys view already answers `in` in O(1) — no need to copy the
+        # previous step's indices into a fresh set on every extraction.
         prev_indices = (
-            set(self.previous_state.selector_map._map.keys())
+            self.previous_state.selector_map._map.keys()
             if self.previous_state is not None
-            else set()
+            else ()
         )
 
         selector_map = SelectorMap()
@@ -175,10 +178,19 @@ class DOMExtractionService:
         except Exception:
             return []
 
+        # Titles come from one plain HTTP read of Chrome's /json tab list;
+        # page.title() (a Playwright round-trip) is only the fallback for a
+        # tab that list didn't cover. The read is blocking urllib (up to a 1s
+        # timeout), so it runs off the event loop.
+        titles = await asyncio.to_thread(_get_tab_titles_sync) if pages else {}
         tabs: list[TabInfo] = []
-        for i, p in enumerate(pages):
+        for p in pages:
             try:
-                tabs.append(TabInfo(tab_id=str(hash(p))[-6:], url=p.url, title=await p.title()))
+                url = p.url
+                title = titles.get(url)
+                if title is None:
+                    title = await p.title()
+                tabs.append(TabInfo(tab_id=str(hash(p))[-6:], url=url, title=title))
             except Exception:
                 continue
         return tabs
@@ -42,13 +42,17 @@ INCLUDE_ATTRIBUTES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class DOMElementNode:
     """
     A simplified DOM element for LLM consumption.
 
     Browser Use calls this SimplifiedNode. We keep it flat and simple:
     the LLM sees an index + tag + text + attributes, and clicks by index.
+
+    Slotted because one is built per interactive element on every step, and
+    the previous state is kept around for new-element diffing — a per-instance
+    __dict__ roughly triples the footprint of these small records.
     """
 
     # Interactive index — this is what the LLM uses to reference the element.
@@ -276,10 +280,10 @@ def _cap_text(text: str, max_len: int = 100) -> str:
     """Truncate text to max_len, appending '...' if truncated."""
     if not text:
         return ""
-    text = text.replace("\n", " ").replace("\t", " ").strip()
-    # Collapse multiple spaces
-    while "  " in text:
-        text = text.replace("  ", " ")
+    # One split/join pass turns newlines/tabs into spaces, collapses runs and
+    # strips the ends, instead of a chain of replace() calls plus a loop that
+    # built a fresh string per halving of each run of spaces.
+    text = " ".join(text.split())
     if len(text) <= max_len:
         return text
     return text[: max_len - 3] + "..."
@@ -20,6 +20,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 import urllib.request
 from dataclasses import dataclass
 from typing import Any
@@ -28,6 +29,12 @@ logger = logging.getLogger(__name__)
 
 _CDP_HOST = "localhost"
 _CDP_PORT = 9222
+
+# Chained browser calls (read → click → type) each resolve the tab's WebSocket
+# URL, which means a fresh HTTP GET of /json every time. Keep the last tab list
+# for a moment so back-to-back calls aimed at the same page share one fetch.
+_TAB_LIST_TTL = 1.5
+_tab_list_cache: tuple[float, list[dict]] | None = None
 _JS_EXTRACT = """
 (function() {
     const MAX_TEXT = 4000;
@@ -115,7 +122,13 @@ _JS_EXTRACT = """
     document.querySelectorAll(DIALOG_SEL).forEach(d => {
         if (!d.offsetParent) return;
         const title = (d.querySelector('h1,h2,h3,h4,[role="heading"]') || {}).innerText || '';
-        const btns = Array.from(d.querySelectorAll('button')).map(b => b.innerText.trim()).filter(Boolean).slice(0, 3);
+        // Stop at the third labelled button instead of reading every one.
+        const btns = [];
+        for (const b of d.querySelectorAll('button')) {
+            const t = b.innerText.trim();
+            if (t) btns.push(t);
+            if (btns.length >= 3) break;
+        }
         dialogs.push({ title: title.trim().slice(0, 60), buttons: btns });
     });
 
@@ -129,13 +142,18 @@ _JS_EXTRACT = """
         bodyText = (clone.innerText || '').replace(/\\n{3,}/g, '\\n\\n').trim().slice(0, MAX_TEXT);
     }
 
-    // 4. ARIA landmark regions (helps orient the agent on complex pages)
-    const landmarks = [];
-    document.querySelectorAll('[role="main"],[role="navigation"],[role="search"],[role="banner"],[role="form"],[role="region"]').forEach(el => {
+    // 4. ARIA landmark regions (helps orient the agent on complex pages).
+    // De-duplicated here: feeds and dashboards repeat role="region" dozens of
+    // times, and each copy would otherwise cross CDP and land in the prompt.
+    const MAX_LANDMARKS = 20;
+    const landmarkSet = new Set();
+    for (const el of document.querySelectorAll('[role="main"],[role="navigation"],[role="search"],[role="banner"],[role="form"],[role="region"]')) {
         const r = el.getAttribute('role');
-        const lbl = el.getAttribute('aria-label') || '';
-        if (r) landmarks.push(lbl ? `${r}:"${lbl}"` : r);
-    });
+        const lbl = (el.getAttribute('aria-label') || '').trim();
+        if (r) landmarkSet.add(lbl ? `${r}:"${lbl}"` : r);
+        if (landmarkSet.size >= MAX_LANDMARKS) break;
+    }
+    const landmarks = Array.from(landmarkSet);
 
     return JSON.stringify({
         url: window.location.href,
@@ -227,29 +245,83 @@ class CDPClient:
         import websockets
         self._ws = await websockets.connect(self._ws_url, ping_interval=None)
 
+    @property
+    def connected(self) -> bool:
+        # A pooled socket can be closed from the remote end (tab closed,
+        # Chrome restarted) while _ws is still set; report that as
+        # disconnected so the pool reconnects instead of failing the call.
+        from websockets.protocol import State
+        return self._ws is not None and self._ws.state is State.OPEN
+
     async def close(self) -> None:
         if self._ws:
             await self._ws.close()
             self._ws = None
 
-    async def call(self, method: str, params: dict | None = None) -> Any:
+    async def call(self, method: str, params: dict | None = None, timeout: float = 2.0) -> Any:
+        """Send one command and return its result, or {} on error / no reply.
+
+        `timeout` bounds the wait for this command's own reply, however many
+        other messages arrive meanwhile — an awaitPromise evaluate can
+        legitimately take far longer than the 2s default. Anything else read
+        in the meantime (events, or the late reply to an earlier call that
+        gave up) is matched by id and skipped, so a stale reply left on a
+        pooled socket is never taken for the current one.
+        """
         self._msg_id += 1
-        msg = json.dumps({"id": self._msg_id, "method": method, "params": params or {}})
-        await self._ws.send(msg)
-        # Read until we get the response for our message id
-        for _ in range(40):  # More attempts, shorter timeout
+        msg_id = self._msg_id
+        await self._ws.send(json.dumps({"id": msg_id, "method": method, "params": params or {}}))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
             try:
-                raw = await asyncio.wait_for(self._ws.recv(), timeout=2.0)
-                data = json.loads(raw)
-                if data.get("id") == self._msg_id:
-                    if "error" in data:
-                        logger.error(f"CDP Error ({method}): {data['error']}")
-                        return {}
-                    return data.get("result", {})
+                raw = await asyncio.wait_for(self._ws.recv(), timeout=remaining)
             except asyncio.TimeoutError:
                 break
+            data = json.loads(raw)
+            if data.get("id") == msg_id:
+                if "error" in data:
+                    logger.error(f"CDP Error ({method}): {data['error']}")
+                    return {}
+                return data.get("result", {})
         return {}
 
+    async def call_batch(self, calls: list[tuple[str, dict | None]]) -> list[Any]:
+        """Send several commands back-to-back, then collect all their replies.
+
+        Chrome handles a session's commands strictly in order, so pipelining
+        keeps their effect identical to awaiting each call() in turn — but
+        costs one round-trip wait instead of one per command (e.g. the
+        mousePressed/mouseReleased pair of a click). Results come back in
+        the order of `calls`; a command that errored or never answered
+        yields {} just like call().
+        """
+        ids: dict[int, int] = {}
+        for pos, (method, params) in enumerate(calls):
+            self._msg_id += 1
+            ids[self._msg_id] = pos
+            await self._ws.send(json.dumps({"id": self._msg_id, "method": method, "params": params or {}}))
+
+        results: list[Any] = [{} for _ in calls]
+        pending = set(ids)
+        for _ in range(40 + len(calls)):
+            if not pending:
+                break
+            try:
+                raw = await asyncio.wait_for(self._ws.recv(), timeout=2.0)
+            except asyncio.TimeoutError:
+                break
+            data = json.loads(raw)
+            msg_id = data.get("id")
+            if msg_id in pending:
+                pending.discard(msg_id)
+                pos = ids[msg_id]
+                if "error" in data:
+                    logger.error(f"CDP Error ({calls[pos][0]}): {data['error']}")
+                else:
+                    results[pos] = data.get("result", {})
+        return results
+
 
 async def _get_active_tab_ws_url(url_hint: str | None = None) -> str | None:
     """Find the WebSocket URL for the active/focused Chrome tab.
@@ -258,19 +330,33 @@ async def _get_active_tab_ws_url(url_hint: str | None = None) -> str | None:
     This is critical in multi-tab scenarios where the first CDP tab
     may not be the one the agent just navigated to.
     """
+    global _tab_list_cache
     try:
+        has_hint = bool(url_hint) and url_hint != "about:blank"
+        hint_stripped = url_hint.rstrip("/") if has_hint else ""
+
+        # Only trust the cached list for an exact/prefix hint match — a miss,
+        # or no hint at all, may mean a tab opened or navigated since.
+        if has_hint and _tab_list_cache is not None:
+            fetched_at, cached_tabs = _tab_list_cache
+            if time.monotonic() - fetched_at < _TAB_LIST_TTL:
+                for tab in cached_tabs:
+                    tab_url = tab.get("url", "").rstrip("/")
+                    if tab_url.startswith(hint_stripped):  # equality is a prefix match too
+                        return tab["webSocketDebuggerUrl"]
+
         req = urllib.request.urlopen(f"http://{_CDP_HOST}:{_CDP_PORT}/json", timeout=1)
         tabs = json.loads(req.read())
         page_tabs = [t for t in tabs if t.get("type") == "page" and t.get("webSocketDebuggerUrl")]
+        _tab_list_cache = (time.monotonic(), page_tabs)
         if not page_tabs:
             return None
 
-        if url_hint and url_hint not in ("about:blank", ""):
-            hint_stripped = url_hint.rstrip("/")
+        if has_hint:
             # Exact or prefix match first
             for tab in page_tabs:
                 tab_url = tab.get("url", "").rstrip("/")
-                if tab_url == hint_stripped or tab_url.startswith(hint_stripped):
+                if tab_url.startswith(hint_stripped):
                     return tab["webSocketDebuggerUrl"]
             # Hostname match fallback
             try:
@@ -312,6 +398,29 @@ def _get_current_url_sync() -> str | None:
     return None
 
 
+def _get_tab_titles_sync() -> dict[str, str]:
+    """
+    Map each open page tab's URL to its title, from the same /json endpoint.
+
+    One local HTTP GET answers for every tab at once, where asking Playwright
+    costs a page.title() round-trip per tab. Returns {} if Chrome is
+    unreachable; duplicate URLs keep the first tab's title.
+    """
+    global _tab_list_cache
+    try:
+        req = urllib.request.urlopen(f"http://{_CDP_HOST}:{_CDP_PORT}/json", timeout=1)
+        tabs = json.loads(req.read())
+    except Exception:
+        return {}
+    page_tabs = [t for t in tabs if t.get("type") == "page" and t.get("webSocketDebuggerUrl")]
+    _tab_list_cache = (time.monotonic(), page_tabs)
+    titles: dict[str, str] = {}
+    for tab in tabs:
+        if tab.get("type") == "page" and tab.get("url"):
+            titles.setdefault(tab["url"], tab.get("title", ""))
+    return titles
+
+
 async def get_page_snapshot(timeout: float = 4.0, url_hint: str | None = None) -> PageSnapshot | None:
     """
     Extract a structured snapshot of the current browser page via CDP.
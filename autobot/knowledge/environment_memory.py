@@ -21,6 +21,10 @@ class EnvironmentMemory:
         self.memory_file = memory_file or (Path.cwd() / "autobot" / "knowledge" / "environment_knowledge.json")
         self.memory_file.parent.mkdir(parents=True, exist_ok=True)
         self.state: dict[str, Any] = self._load()
+        # get_summary_text() runs on every agent step but the knowledge only
+        # changes through the record_*() methods, which all go through save().
+        # None = stale; rebuilt on the next read.
+        self._summary_text: str | None = None
 
     def _load(self) -> dict[str, Any]:
         """Load persistent memory from JSON file."""
@@ -40,6 +44,7 @@ class EnvironmentMemory:
 
     def save(self) -> None:
         """Save persistent memory state to JSON."""
+        self._summary_text = None
         try:
             self.memory_file.write_text(json.dumps(self.state, indent=2), encoding="utf-8")
             logger.info("💾 Environment memory state saved.")
@@ -78,6 +83,11 @@ class EnvironmentMemory:
 
     def get_summary_text(self) -> str:
         """Generate text summary of environment knowledge for LLM prompt context."""
+        if self._summary_text is None:
+            self._summary_text = self._build_summary_text()
+        return self._summary_text
+
+    def _build_summary_text(self) -> str:
         lines = ["## Host Environment Knowledge Graph"]
 
         sw = self.state.get("installed_software", {})
@@ -7,16 +7,69 @@ lessons learned, and edge-case fallbacks, saving them into persistent skill file
 """
 from __future__ import annotations
 
+import copy
+import itertools
 import json
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional: it parses several times faster than the stdlib and takes
+# bytes directly, which skips a UTF-8 decode. Skill files are plain JSON that
+# either parser reads identically.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=256)
+def _read_skill_file(path: str, mtime: float) -> Mapping[str, Any]:
+    """Parse a skill JSON file once per (path, mtime).
+
+    find_matching_skill() runs at the start of every task and used to re-read
+    and re-parse every file in the skills directory each time. Keying on mtime
+    means an edited or re-saved skill is picked up on the next call, while an
+    unchanged one costs a stat() instead of a read + json.loads. The result is
+    shared between callers, so it is returned read-only.
+    """
+    data = _json_loads(Path(path).read_bytes())
+    if not isinstance(data, dict):
+        raise ValueError("skill file is not a JSON object")
+    return MappingProxyType(data)
+
+
+@lru_cache(maxsize=256)
+def _read_skill_keywords(path: str, mtime: float) -> tuple[str, ...]:
+    """Match-ready keywords for a skill file, normalised once per (path, mtime).
+
+    Validation and lowercasing happen here rather than inside the scoring
+    loop, so find_matching_skill() just iterates a stored tuple. The whole
+    record is checked too: a partial or malformed file yields no keywords, so
+    it can never outscore a valid skill and then fail to load as the winner.
+    """
+    data = _read_skill_file(path, mtime)
+    try:
+        LearnedSkill(**data)
+    except TypeError as e:
+        logger.debug(f"Skipping malformed skill file {path}: {e}")
+        return ()
+    raw = data.get("keywords") or ()
+    return tuple(kw.strip().lower() for kw in raw if isinstance(kw, str) and kw.strip())
+
+
+def _load_skill_data(path: Path) -> Mapping[str, Any]:
+    return _read_skill_file(str(path), path.stat().st_mtime)
+
 
 @dataclass
 class LearnedSkill:
@@ -44,8 +97,10 @@ class LearnedSkill:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> LearnedSkill:
-        return cls(**data)
+    def from_dict(cls, data: Mapping[str, Any]) -> LearnedSkill:
+        # Deep-copied so a cached mapping from _read_skill_file() is never
+        # mutated through the returned skill (distill_from_run edits it).
+        return cls(**copy.deepcopy(dict(data)))
 
 
 class SkillDistiller:
@@ -124,7 +179,7 @@ class SkillDistiller:
             # Prefer the shorter proven path — that's the whole point of learning.
             if len(proven_steps) < len(existing.proven_steps):
                 existing.proven_steps = proven_steps
-            existing.lessons_learned = self._dedupe(existing.lessons_learned + lessons)[:10]
+            existing.lessons_learned = self._dedupe(itertools.chain(existing.lessons_learned, lessons), 10)
             self.save_skill(existing)
             return existing
 
@@ -134,7 +189,7 @@ class SkillDistiller:
             keywords=self._keywords(goal),
             prerequisites=[],
             proven_steps=proven_steps,
-            lessons_learned=self._dedupe(lessons)[:10],
+            lessons_learned=self._dedupe(lessons, 10),
             created_at=datetime.now(timezone.utc).isoformat(),
         )
         self.save_skill(skill)
@@ -145,19 +200,23 @@ class SkillDistiller:
         if not path.exists():
             return None
         try:
-            return LearnedSkill.from_dict(json.loads(path.read_text(encoding="utf-8")))
+            return LearnedSkill.from_dict(_load_skill_data(path))
         except Exception as e:
             logger.debug(f"Could not load existing skill {path}: {e}")
             return None
 
     @staticmethod
-    def _dedupe(items: list[str]) -> list[str]:
+    def _dedupe(items: Iterable[str], limit: int) -> list[str]:
+        """First `limit` distinct items, in order — stops as soon as it has them
+        rather than deduplicating everything and slicing afterwards."""
         seen: set[str] = set()
         out: list[str] = []
         for i in items:
             if i not in seen:
                 seen.add(i)
                 out.append(i)
+                if len(out) >= limit:
+                    break
         return out
 
     @staticmethod
@@ -168,13 +227,14 @@ class SkillDistiller:
         FIRST keyword hit — leaving 'the'/'and'/'to' in would make unrelated
         skills match nearly every goal.
         """
-        stop = {
-            "the", "and", "for", "with", "from", "into", "that", "this", "then",
-            "open", "http", "https", "www", "com", "use", "using", "get", "make",
-            "a", "an", "of", "to", "in", "on", "at", "by", "it", "is", "are",
-        }
         words = re.findall(r"[a-z0-9]{3,}", goal.lower())
-        return SkillDistiller._dedupe([w for w in words if w not in stop])[:8]
+        return SkillDistiller._dedupe((w for w in words if w not in SkillDistiller._STOPWORDS), 8)
+
+    _STOPWORDS = frozenset({
+        "the", "and", "for", "with", "from", "into", "that", "this", "then",
+        "open", "http", "https", "www", "com", "use", "using", "get", "make",
+        "a", "an", "of", "to", "in", "on", "at", "by", "it", "is", "are",
+    })
 
     # A skill must match this fraction of its keywords to be considered
     # relevant. Returning on the FIRST keyword hit made a skill with generic
@@ -193,31 +253,37 @@ class SkillDistiller:
         than whichever file happened to be read first.
         """
         goal_words = set(re.findall(r"[a-z0-9]{3,}", goal.lower()))
-        best: LearnedSkill | None = None
+        best_path: Path | None = None
         best_score = 0.0
 
         for filepath in self.skills_dir.glob("*.json"):
             try:
-                data = json.loads(filepath.read_text(encoding="utf-8"))
-                skill = LearnedSkill.from_dict(data)
+                keywords = _read_skill_keywords(str(filepath), filepath.stat().st_mtime)
             except Exception as e:
                 logger.debug(f"Error loading skill file {filepath}: {e}")
                 continue
 
-            if not skill.keywords:
+            if not keywords:
                 continue
-            hits = sum(1 for kw in skill.keywords if kw.lower() in goal_words)
+            hits = sum(1 for kw in keywords if kw in goal_words)
             # One word in common is coincidence; two is signal. Without this
             # floor, a two-keyword skill matches on a single generic word
             # ("list", "open", "file") at exactly the overlap threshold.
-            min_hits = 1 if len(skill.keywords) == 1 else 2
+            min_hits = 1 if len(keywords) == 1 else 2
             if hits < min_hits:
                 continue
-            score = hits / len(skill.keywords)
+            score = hits / len(keywords)
             if score > best_score:
-                best, best_score = skill, score
+                best_path, best_score = filepath, score
 
-        if best is not None and best_score >= self._MIN_KEYWORD_OVERLAP:
+        # Only the winner is materialised as a LearnedSkill.
+        best: LearnedSkill | None = None
+        if best_path is not None and best_score >= self._MIN_KEYWORD_OVERLAP:
+            try:
+                best = LearnedSkill.from_dict(_load_skill_data(best_path))
+            except Exception as e:
+                logger.debug(f"Malformed skill file for best match: {e}")
+        if best is not None:
             logger.info(
                 f"💡 Learned Skill Match: '{best.name}' "
                 f"({best_score:.0%} keyword overlap) for goal '{goal[:40]}'"
@@ -292,6 +292,27 @@ def _url_pattern(url: str) -> str:
     return domain[:40]
 
 
+def _fragment_re(*fragments: str) -> re.Pattern[str]:
+    """One case-insensitive alternation over literal URL fragments."""
+    return re.compile("|".join(map(re.escape, fragments)), re.IGNORECASE)
+
+
+# URL fragment → page type, checked in order (first match wins). Compiled once
+# at import: this runs for every recorded step, and a single regex scan of the
+# URL replaces a url.lower() copy plus a Python-level `in` test per fragment.
+_PAGE_TYPE_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (_fragment_re("login", "signin", "sign-in", "auth", "authenticate", "oauth", "sso"), "auth"),
+    (_fragment_re("register", "signup", "sign-up", "create-account"), "registration"),
+    (_fragment_re("github.com", "gitlab.com", "bitbucket.org"), "code_repo"),
+    (_fragment_re("leetcode", "codeforces", "hackerrank", "codewars", "atcoder"), "coding_challenge"),
+    (_fragment_re("kaggle.com", "huggingface.co", "colab.research"), "data_platform"),
+    (_fragment_re("google.com/search", "bing.com/search", "duckduckgo.com", "search?q=", "results"), "search"),
+    (_fragment_re("404", "error", "not-found", "not_found"), "error"),
+    (_fragment_re("/docs/", "/documentation/", "readthedocs", "developer.mozilla"), "docs"),
+    (_fragment_re("/dashboard", "/admin", "/settings", "/account", "/profile"), "dashboard"),
+)
+
+
 def _infer_page_type(url: str, action_params: dict) -> str:
     """
     Heuristically classify the page type from URL and action params.
@@ -299,35 +320,9 @@ def _infer_page_type(url: str, action_params: dict) -> str:
     Used as a context key in PolicyMemory so the agent learns that
     e.g. "form_input" pages favor keyboard.type over mouse.click.
     """
-    url_lower = url.lower()
-
-    # Auth / login
-    if any(k in url_lower for k in ["login", "signin", "sign-in", "auth", "authenticate", "oauth", "sso"]):
-        return "auth"
-    # Registration
-    if any(k in url_lower for k in ["register", "signup", "sign-up", "create-account"]):
-        return "registration"
-    # Code repos and editors
-    if any(k in url_lower for k in ["github.com", "gitlab.com", "bitbucket.org"]):
-        return "code_repo"
-    # Coding challenges
-    if any(k in url_lower for k in ["leetcode", "codeforces", "hackerrank", "codewars", "atcoder"]):
-        return "coding_challenge"
-    # Data platforms
-    if any(k in url_lower for k in ["kaggle.com", "huggingface.co", "colab.research"]):
-        return "data_platform"
-    # Search pages
-    if any(k in url_lower for k in ["google.com/search", "bing.com/search", "duckduckgo.com", "search?q=", "results"]):
-        return "search"
-    # Error pages
-    if any(k in url_lower for k in ["404", "error", "not-found", "not_found"]):
-        return "error"
-    # Docs / documentation pages
-    if any(k in url_lower for k in ["/docs/", "/documentation/", "readthedocs", "developer.mozilla"]):
-        return "docs"
-    # Dashboard / admin panels
-    if any(k in url_lower for k in ["/dashboard", "/admin", "/settings", "/account", "/profile"]):
-        return "dashboard"
+    for pattern, page_type in _PAGE_TYPE_PATTERNS:
+        if pattern.search(url):
+            return page_type
     # Action-based hints
     call = action_params.get("call", "")
     if "keyboard.type" in call or "dom.input" in call:
@@ -399,21 +394,25 @@ def _param_hash(params: dict) -> str:
         return "unknown"
 
 
+# Error fragment → category, checked in order like _PAGE_TYPE_PATTERNS: one
+# case-insensitive scan per category instead of error.lower() plus a
+# Python-level `in` test per fragment.
+_ERROR_CATEGORY_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (_fragment_re("timeout", "timed out", "time out"), "timeout"),
+    (_fragment_re("not found", "does not exist", "no element"), "not_found"),
+    (_fragment_re("permission", "denied", "forbidden", "unauthorized"), "permission"),
+    (_fragment_re("click failed", "element not clickable", "intercepted"), "click_failed"),
+    (_fragment_re("network", "connection", "dns"), "network"),
+)
+
+
 def _classify_error(error: str | None) -> str:
     """Classify an error string into a category."""
     if not error:
         return ""
-    e = error.lower()
-    if any(k in e for k in ["timeout", "timed out", "time out"]):
-        return "timeout"
-    if any(k in e for k in ["not found", "does not exist", "no element"]):
-        return "not_found"
-    if any(k in e for k in ["permission", "denied", "forbidden", "unauthorized"]):
-        return "permission"
-    if any(k in e for k in ["click failed", "element not clickable", "intercepted"]):
-        return "click_failed"
-    if any(k in e for k in ["network", "connection", "dns"]):
-        return "network"
+    for pattern, category in _ERROR_CATEGORY_PATTERNS:
+        if pattern.search(error):
+            return category
     return "other"
 
 
@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -51,18 +52,20 @@ class LessonExtractor:
         if not history:
             return stored
 
-        try:
-            # 1. Repeated failure patterns (same action failed 3+ times on same URL)
-            stored += self._extract_failure_lessons(goal, history)
+        # One memory-file write for the whole run's lessons, not one per lesson.
+        with self._memory.batch():
+            try:
+                # 1. Repeated failure patterns (same action failed 3+ times on same URL)
+                stored += self._extract_failure_lessons(goal, history)
 
-            # 2. Successful tool discoveries (something worked well → remember it)
-            stored += self._extract_success_lessons(goal, history)
+                # 2. Successful tool discoveries (something worked well → remember it)
+                stored += self._extract_success_lessons(goal, history)
 
-            # 3. Navigation insights (timing, URL patterns)
-            stored += self._extract_nav_lessons(goal, history)
+                # 3. Navigation insights (timing, URL patterns)
+                stored += self._extract_nav_lessons(goal, history)
 
-        except Exception as e:
-            logger.debug(f"LessonExtractor failed (non-fatal): {e}")
+            except Exception as e:
+                logger.debug(f"LessonExtractor failed (non-fatal): {e}")
 
         if stored:
             logger.info(f"📚 LessonExtractor stored {len(stored)} lessons from run {run_id}")
@@ -175,10 +178,16 @@ class LessonExtractor:
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Scheme and "www." prefix, stripped in one pass rather than two re.sub() scans.
+_URL_PREFIX_RE = re.compile(r"^(?:https?://)?(?:www\.)?")
+
+
+# A run's history revisits a handful of URLs, and _find_what_worked() re-keys
+# the whole history once per failure group — memoize the pure string mapping.
+@lru_cache(maxsize=512)
 def _url_key(url: str) -> str:
     """Extract domain + first path segment."""
-    url = re.sub(r"^https?://", "", url.lower().strip())
-    url = re.sub(r"^www\.", "", url)
+    url = _URL_PREFIX_RE.sub("", url.lower().strip(), count=1)
     parts = url.split("/")
     if len(parts) > 1 and parts[1]:
         return f"{parts[0]}/{parts[1][:20]}"
@@ -38,9 +38,13 @@ logger = logging.getLogger(__name__)
 _DEFAULT_POLICY_PATH = Path.home() / ".autobot" / "policy.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionPolicy:
-    """Learned statistics for one (context, action_tool) pair."""
+    """Learned statistics for one (context, action_tool) pair.
+
+    Slotted: a long-lived policy holds one of these per (context, tool), and
+    update() touches its counters on every recorded step.
+    """
     action_tool: str
     success_count: int = 0
     failure_count: int = 0
@@ -165,9 +169,11 @@ class PolicyMemory:
         """
         ctx_key = _make_key(url_pattern, page_type, task_kw)
         with self._lock:
-            if action_tool not in self._policy[ctx_key]:
-                self._policy[ctx_key][action_tool] = ActionPolicy(action_tool)
-            self._policy[ctx_key][action_tool].update(success, reward)
+            tools = self._policy[ctx_key]
+            ap = tools.get(action_tool)
+            if ap is None:
+                ap = tools[action_tool] = ActionPolicy(action_tool)
+            ap.update(success, reward)
             self._dirty = True
 
     # ── Query ─────────────────────────────────────────────────────────────────
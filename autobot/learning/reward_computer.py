@@ -191,6 +191,25 @@ def _semantic_match(goal: str, url: str) -> bool:
     return any(w in url_lower for w in goal_words)
 
 
+# Permanent failures — retrying will definitely not help. Checked before
+# _TRANSIENT_RE, so an error matching both counts as permanent. Each is one
+# precompiled case-insensitive alternation, so classifying an error is two
+# scans with no lowercased copy.
+_PERMANENT_RE = re.compile("|".join(map(re.escape, (
+    "permission denied", "forbidden", "403", "404", "not found",
+    "access denied", "unauthorized", "authentication failed",
+    "invalid url", "no such file", "element not found",
+    "selector not found", "does not exist",
+))), re.IGNORECASE)
+
+# Transient failures — almost certainly recoverable with a brief wait.
+_TRANSIENT_RE = re.compile("|".join(map(re.escape, (
+    "timeout", "timed out", "connection refused", "network", "429",
+    "rate limit", "resource exhausted", "temporarily unavailable",
+    "service unavailable", "503",
+))), re.IGNORECASE)
+
+
 def _classify_error_severity(error: str | None) -> str:
     """
     Return 'permanent', 'retryable', or 'transient' for an error string.
@@ -201,27 +220,10 @@ def _classify_error_severity(error: str | None) -> str:
     """
     if not error:
         return "retryable"
-    e = error.lower()
-
-    # Permanent failures — retrying will definitely not help
-    _PERMANENT = (
-        "permission denied", "forbidden", "403", "404", "not found",
-        "access denied", "unauthorized", "authentication failed",
-        "invalid url", "no such file", "element not found",
-        "selector not found", "does not exist",
-    )
-    if any(k in e for k in _PERMANENT):
+    if _PERMANENT_RE.search(error):
         return "permanent"
-
-    # Transient failures — almost certainly recoverable with a brief wait
-    _TRANSIENT = (
-        "timeout", "timed out", "connection refused", "network", "429",
-        "rate limit", "resource exhausted", "temporarily unavailable",
-        "service unavailable", "503",
-    )
-    if any(k in e for k in _TRANSIENT):
+    if _TRANSIENT_RE.search(error):
         return "transient"
-
     return "retryable"
 
 
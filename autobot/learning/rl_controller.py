@@ -21,10 +21,13 @@ from __future__ import annotations
 
 import logging
 import re
+import secrets
 import time
-import uuid
+from functools import lru_cache
 from typing import Any
 
+from autobot.learning.experience_store import _fragment_re
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,7 +60,7 @@ class RLController:
         self._store = None
         self._reward = None
         self._policy = None
-        self._run_id = str(uuid.uuid4())[:8]
+        self._run_id = secrets.token_hex(4)
         self._save_interval = 10     # save policy every N steps
         self._step_counter = 0
         self._enabled = True
@@ -70,12 +73,16 @@ class RLController:
         if self._store is not None:
             return self._enabled
         try:
-            from autobot.learning.experience_store import ExperienceStore, _url_pattern, _task_keywords, _action_tool, StepState
-            from autobot.learning.reward_computer import RewardComputer, RewardContext
-            from autobot.learning.policy_memory import PolicyMemory
-            self._store = ExperienceStore()
-            self._reward = RewardComputer()
-            self._policy = PolicyMemory()
+            # Reuse the module-level singletons: importing these modules already
+            # builds them, so constructing our own would open the SQLite DB and
+            # load the policy JSON a second time — and leave two PolicyMemory
+            # instances overwriting each other's saves.
+            from autobot.learning.experience_store import experience_store, _url_pattern, _task_keywords, _action_tool, StepState
+            from autobot.learning.reward_computer import reward_computer, RewardContext
+            from autobot.learning.policy_memory import policy_memory
+            self._store = experience_store
+            self._reward = reward_computer
+            self._policy = policy_memory
             self._url_pattern = _url_pattern
             self._task_keywords = _task_keywords
             self._action_tool = _action_tool
@@ -270,26 +277,34 @@ class RLController:
 
     def new_run(self) -> None:
         """Start a fresh run ID. Call at the beginning of each agent run."""
-        self._run_id = str(uuid.uuid4())[:8]
+        self._run_id = secrets.token_hex(4)
         self._goal_counts.clear()
         logger.debug(f"RL Controller: new run {self._run_id}")
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# URL fragment → page type, checked in order (first match wins), in the same
+# shape and built with the same case-insensitive helper as experience_store's
+# table so the two classifiers can't drift apart. This one keeps its own,
+# shorter fragment lists.
+_PAGE_TYPE_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (_fragment_re("login", "signin", "auth"), "auth"),
+    (_fragment_re("github.com", "gitlab.com"), "code_repo"),
+    (_fragment_re("leetcode", "codeforces", "hackerrank"), "coding_challenge"),
+    (_fragment_re("kaggle.com"), "data_platform"),
+    (_fragment_re("google.com/search", "bing.com/search"), "search"),
+)
+
+
+# Both the action-selection and the update path infer the page type of the
+# same URL on every step.
+@lru_cache(maxsize=256)
 def _infer_page_type_from_url(url: str) -> str:
     """Fast URL-based page type inference (no DOM needed)."""
-    url_lower = url.lower()
-    if any(k in url_lower for k in ["login", "signin", "auth"]):
-        return "auth"
-    if any(k in url_lower for k in ["github.com", "gitlab.com"]):
-        return "code_repo"
-    if any(k in url_lower for k in ["leetcode", "codeforces", "hackerrank"]):
-        return "coding_challenge"
-    if any(k in url_lower for k in ["kaggle.com"]):
-        return "data_platform"
-    if any(k in url_lower for k in ["google.com/search", "bing.com/search"]):
-        return "search"
+    for pattern, page_type in _PAGE_TYPE_PATTERNS:
+        if pattern.search(url):
+            return page_type
     return "general"
 
 
@@ -18,8 +18,10 @@ import logging
 import os
 import re
 import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,9 @@ class MemoryStore:
         self.path = Path(env_path) if env_path else (path or _DEFAULT_PATH)
         self._data: dict[str, dict] = {}
         self._lock = threading.Lock()
+        # Open batch() blocks, and whether a write was deferred inside one.
+        self._batch_depth = 0
+        self._save_pending = False
         self._load()
 
     # ── Persistence ──────────────────────────────────────────────────────────
@@ -55,6 +60,33 @@ class MemoryStore:
         except Exception as e:
             logger.warning(f"Memory save failed (non-fatal): {e}")
 
+    def _persist(self) -> None:
+        # Caller must hold self._lock. Inside batch() the write is deferred to
+        # the end of the block instead of re-serializing the whole store once
+        # per change.
+        if self._batch_depth:
+            self._save_pending = True
+        else:
+            self._save()
+
+    @contextmanager
+    def batch(self) -> Iterator["MemoryStore"]:
+        """Coalesce the disk writes of every remember()/forget() in the block into one.
+
+        LessonExtractor stores a run's lessons one remember() at a time; each
+        used to rewrite the entire memory file.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._save_pending:
+                    self._save_pending = False
+                    self._save()
+
     # ── Write ─────────────────────────────────────────────────────────────────
 
     def remember(self, key: str, value: str) -> None:
@@ -68,7 +100,7 @@ class MemoryStore:
                 "updated": now,
                 "hits": (existing["hits"] if existing else 0),
             }
-            self._save()
+            self._persist()
         logger.info(f"🧠 Remembered: {key} = {value[:60]}")
 
     def forget(self, key: str) -> None:
@@ -76,7 +108,7 @@ class MemoryStore:
         with self._lock:
             if key in self._data:
                 del self._data[key]
-                self._save()
+                self._persist()
 
     # ── Read ──────────────────────────────────────────────────────────────────
 
@@ -110,7 +142,7 @@ class MemoryStore:
                 entry["hits"] = entry.get("hits", 0) + 1
                 results.append((key, entry["value"]))
             if results:
-                self._save()  # persist hit counts
+                self._persist()  # persist hit counts
         return results
 
     def all_entries(self) -> list[tuple[str, str]]:
@@ -167,7 +199,7 @@ class MemoryStore:
                     removed += 1
 
             if removed:
-                self._save()
+                self._persist()
 
         if removed:
             logger.info(f"🧹 Memory pruned: {removed} stale entries removed ({len(self._data)} remain)")
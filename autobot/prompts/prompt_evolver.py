@@ -41,6 +41,7 @@ from __future__ import annotations
 import re
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 
@@ -478,21 +479,31 @@ class PromptEvolver:
 
 # ── Utilities ─────────────────────────────────────────────────────────────────
 
+# These run on every step's trajectory check and goal-history comparison, so
+# the patterns are compiled once here instead of per call.
+_WHITESPACE_RE = re.compile(r"\s+")
+# Everything up to the first "/" after an optional scheme — the domain in one
+# match, instead of a scheme-stripping pass followed by a path-stripping pass.
+_URL_DOMAIN_RE = re.compile(r"^(?:https?://)?([^/]*)")
+_GOAL_WORD_RE = re.compile(r"\b[a-zA-Z]{4,}\b")
+
+
+# Each step re-normalises the last 10 goals (twice: loop count and most
+# repeated), nine of which it already normalised on earlier steps.
+@lru_cache(maxsize=256)
 def _normalise_goal(goal: str) -> str:
     """Normalise a goal string for comparison (lowercase, strip whitespace)."""
-    return re.sub(r"\s+", " ", goal.lower().strip())[:100]
+    return _WHITESPACE_RE.sub(" ", goal.lower().strip())[:100]
 
 
 def _format_url(url: str) -> str:
     """Format a URL for display (domain only)."""
-    url = re.sub(r"^https?://", "", url)
-    url = re.sub(r"/.*", "", url)
-    return url[:40]
+    return _URL_DOMAIN_RE.match(url).group(1)[:40]
 
 
 def _url_relevant_to_goal(url: str, goal: str) -> bool:
     """Check if the URL seems relevant to the task goal."""
-    goal_words = set(re.findall(r"\b[a-zA-Z]{4,}\b", goal.lower()))
+    goal_words = set(_GOAL_WORD_RE.findall(goal.lower()))
     stop = {"search", "find", "open", "navigate", "click", "help", "with", "that", "this"}
     goal_words -= stop
     url_lower = url.lower()
@@ -21,7 +21,10 @@ import json
 import os
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from itertools import islice
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -35,16 +38,47 @@ from ..agent.runner import AgentRunner
 from ..computer.liveness import SystemLivenessManager
 
 
+_RUN_LOG_CAP_DEFAULT = 5000
+
+
+def _run_log_cap() -> int:
+    """AUTOBOT_RUN_LOG_CAP as a positive int, or the default if unset or invalid.
+
+    Read at import time, so a typo in .env must not take the whole dashboard
+    down with a ValueError.
+    """
+    try:
+        return max(1, int(os.getenv("AUTOBOT_RUN_LOG_CAP", "")))
+    except ValueError:
+        return _RUN_LOG_CAP_DEFAULT
+
+
 # ── State ─────────────────────────────────────────────────────────────────────
 
 _agent_runner: AgentRunner | None = None
 _agent_status: str = "idle"  # idle | running | done | failed | cancelled
 _active_run_id: str | None = None
-_run_log: list[str] = []
+# Bounded: a long or chatty run appends a few lines per step, and the buffer
+# only ever clears when the next run starts. A deque drops the oldest line in
+# O(1) once full. The saved console.log keeps the newest lines up to the cap.
+_run_log: deque[str] = deque(maxlen=_run_log_cap())
 _ws_clients: set[WebSocket] = set()
 _event_loop: asyncio.AbstractEventLoop | None = None
 _liveness = SystemLivenessManager()
 
+# Resolved once at import rather than per request: Path.resolve() walks the
+# filesystem (readlink/stat per component) and these never change at runtime.
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_RUNS_ROOT = _PROJECT_ROOT / "runs"
+# get_run()'s containment check compares against the real path of runs/ (it
+# may itself be a symlink, e.g. onto a bigger disk); resolve that side once too.
+_RUNS_ROOT_REAL = _RUNS_ROOT.resolve()
+# Writes run history to disk. A single worker keeps saves in call order — a
+# cancel's save followed by the run thread's own final save lands in that
+# order — while the caller (often an HTTP handler) returns without waiting
+# on the filesystem. Pending writes still finish at interpreter exit.
+_history_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-history")
+
 # Guards the check-then-set on _agent_status/_agent_runner in start_agent_run().
 # Route handlers here are sync `def`s, which FastAPI dispatches to its worker
 # threadpool — so two near-simultaneous POST /api/agent/run requests can both
@@ -58,7 +92,9 @@ _run_start_lock = threading.Lock()
 # ── Logging + WebSocket broadcast ────────────────────────────────────────────
 
 def _log(msg: str) -> None:
-    ts = datetime.now().strftime("%H:%M:%S")
+    # time.strftime formats the local time straight from a struct_time; it
+    # doesn't build a datetime object for every line the agent logs.
+    ts = time.strftime("%H:%M:%S")
     line = f"[{ts}] {msg}"
     _run_log.append(line)
     if _event_loop and not _event_loop.is_closed():
@@ -279,12 +315,12 @@ def cancel_agent(run_id: str = ""):
 
 
 def _save_run_history(run_id: str, goal: str, success: bool, result: str):
-    """Save run details so they show up in historical runs."""
+    """Save run details so they show up in historical runs.
+
+    The record and console log are captured now; the disk writes are queued
+    on _history_writer.
+    """
     try:
-        runs_root = Path(__file__).resolve().parent.parent.parent / "runs"
-        run_dir = runs_root / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
-        
         hist = {
             "plan_name": goal[:50],
             "description": goal,
@@ -294,8 +330,17 @@ def _save_run_history(run_id: str, goal: str, success: bool, result: str):
             "completed_steps": _agent_runner.current_step if _agent_runner else 0,
             "total_steps": _agent_runner.max_steps if _agent_runner else 0,
         }
+        console = "\n".join(_run_log)
+        _history_writer.submit(_write_run_files, _RUNS_ROOT / run_id, hist, console)
+    except Exception as e:
+        _log(f"Failed to save run history: {e}")
+
+
+def _write_run_files(run_dir: Path, hist: dict[str, Any], console: str) -> None:
+    try:
+        run_dir.mkdir(parents=True, exist_ok=True)
         (run_dir / "history.json").write_text(json.dumps(hist, indent=2), encoding="utf-8")
-        (run_dir / "console.log").write_text("\n".join(_run_log), encoding="utf-8")
+        (run_dir / "console.log").write_text(console, encoding="utf-8")
     except Exception as e:
         _log(f"Failed to save run history: {e}")
 
@@ -317,7 +362,7 @@ def get_settings():
 
 @app.post("/api/settings")
 def update_settings(req: SettingsUpdate):
-    env_path = Path(__file__).resolve().parent.parent.parent / ".env"
+    env_path = _PROJECT_ROOT / ".env"
     updates: dict[str, str] = {}
     if req.llm_provider is not None:
         updates["AUTOBOT_LLM_PROVIDER"] = req.llm_provider
@@ -359,10 +404,9 @@ def update_settings(req: SettingsUpdate):
 
 @app.get("/api/runs")
 def get_runs():
-    runs_root = Path(__file__).resolve().parent.parent.parent / "runs"
     runs = []
-    if runs_root.exists():
-        for run_dir in sorted(runs_root.iterdir(), reverse=True):
+    if _RUNS_ROOT.exists():
+        for run_dir in sorted(_RUNS_ROOT.iterdir(), reverse=True):
             if not run_dir.is_dir():
                 continue
             history_file = run_dir / "history.json"
@@ -392,10 +436,9 @@ def get_runs():
 
 @app.delete("/api/runs")
 def clear_all_runs():
-    runs_root = Path(__file__).resolve().parent.parent.parent / "runs"
-    if runs_root.exists():
+    if _RUNS_ROOT.exists():
         import shutil
-        for item in runs_root.iterdir():
+        for item in _RUNS_ROOT.iterdir():
             if item.is_dir():
                 try:
                     shutil.rmtree(item)
@@ -416,12 +459,14 @@ def get_run(run_id: str):
             "logs": list(_run_log),
             "active": True,
         }
-    runs_root = (Path(__file__).resolve().parent.parent.parent / "runs").resolve()
+    runs_root = _RUNS_ROOT_REAL
     run_dir = (runs_root / run_id).resolve()
     # run_id comes straight from the URL path with no validation. Without this
     # check, a request like GET /api/run/..%2F..%2F..%2FWindows%2FSystem32%2Fsome_dir
     # resolves outside runs_root entirely — reading history.json/console.log
     # from anywhere on disk that happens to contain files with those names.
+    # run_dir itself must stay a real resolve(): a lexical abspath() would
+    # let a symlink inside runs/ point the read anywhere.
     if runs_root not in run_dir.parents and run_dir != runs_root:
         raise HTTPException(status_code=400, detail="Invalid run_id")
     if not run_dir.is_dir():
@@ -518,7 +563,7 @@ def respond_human_input(req: ApprovalResponse):
 @app.get("/api/logs")
 def get_logs(limit: int = 500):
     global _run_log
-    return {"logs": _run_log[-limit:] if _run_log else []}
+    return {"logs": list(islice(_run_log, max(0, len(_run_log) - limit), None))}
 
 class ChatRequest(BaseModel):
     message: str
@@ -803,7 +848,7 @@ async def ws_events_alias(websocket: WebSocket):
 
 from fastapi.responses import HTMLResponse, FileResponse
 
-_frontend_dist = Path(__file__).resolve().parent.parent.parent / "frontend" / "dist"
+_frontend_dist = _PROJECT_ROOT / "frontend" / "dist"
 
 if _frontend_dist.exists():
     # Mount StaticFiles only for assets folder so it never intercepts root level /ws/ or /api/ requests
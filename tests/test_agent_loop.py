@@ -0,0 +1,208 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from autobot.agent.loop import AgentLoop, _normalize_url
+from autobot.agent.models import (
+    ACTION_NAMES,
+    ActionModel,
+    ComputerCallAction,
+    NavigateAction,
+    NewTabAction,
+    WaitAction,
+)
+
+
+def _make_page(url):
+    page = MagicMock()
+    page.url = url
+    page.goto = AsyncMock()
+    return page
+
+
+def _make_loop(page):
+    # Skip __init__: it builds a real Computer, memory stores and prompts,
+    # none of which the action handlers under test touch.
+    loop = AgentLoop.__new__(AgentLoop)
+    loop.page = page
+    loop._cancel_event = threading.Event()
+    loop._last_url = None
+    loop._last_url_at = 0.0
+    return loop
+
+
+class TestNormalizeUrl(unittest.TestCase):
+    def test_bare_host_gets_https(self):
+        self.assertEqual(_normalize_url("github.com"), "https://github.com")
+        self.assertEqual(_normalize_url("  github.com/a?b=1  "), "https://github.com/a?b=1")
+
+    def test_host_with_port_gets_https(self):
+        self.assertEqual(_normalize_url("localhost:3000"), "https://localhost:3000")
+        self.assertEqual(_normalize_url("example.com:8080/path"), "https://example.com:8080/path")
+
+    def test_existing_scheme_is_kept(self):
+        for url in (
+            "https://example.com",
+            "HTTPS://Example.com",
+            "Http://example.com",
+            "ftp://files.example.com",
+            "mailto:a@b.com",
+            "javascript:void(0)",
+            "about:blank",
+            "chrome://settings",
+            "file:///tmp/report.html",
+            "data:text/html,hi",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(_normalize_url(url), url)
+
+
+class TestNavigate(unittest.TestCase):
+    def test_repeat_within_two_seconds_is_a_no_op(self):
+        page = _make_page("https://github.com/")
+        loop = _make_loop(page)
+        asyncio.run(loop._execute_navigate(NavigateAction(url="github.com"), None))
+        page.goto.reset_mock()
+
+        result = asyncio.run(loop._execute_navigate(NavigateAction(url="github.com"), None))
+
+        self.assertTrue(result.success)
+        self.assertFalse(result.page_changed)
+        self.assertIn("Already on", result.extracted_content)
+        page.goto.assert_not_awaited()
+
+    def test_repeat_after_two_seconds_reloads(self):
+        page = _make_page("https://github.com/")
+        loop = _make_loop(page)
+        asyncio.run(loop._execute_navigate(NavigateAction(url="github.com"), None))
+        loop._last_url_at -= 2.0
+
+        result = asyncio.run(loop._execute_navigate(NavigateAction(url="github.com"), None))
+
+        self.assertTrue(result.page_changed)
+        self.assertEqual(page.goto.await_count, 2)
+
+    def test_current_url_not_navigated_to_by_us_is_loaded(self):
+        page = _make_page("https://github.com/")
+        loop = _make_loop(page)
+
+        result = asyncio.run(loop._execute_navigate(NavigateAction(url="github.com"), None))
+
+        self.assertTrue(result.page_changed)
+        page.goto.assert_awaited_once_with("https://github.com", wait_until="domcontentloaded")
+
+    def test_different_url_navigates(self):
+        page = _make_page("https://github.com/")
+        loop = _make_loop(page)
+
+        result = asyncio.run(loop._execute_navigate(NavigateAction(url="https://example.com"), None))
+
+        self.assertTrue(result.success)
+        self.assertTrue(result.page_changed)
+        page.goto.assert_awaited_once_with("https://example.com", wait_until="domcontentloaded")
+
+
+class TestNewTab(unittest.TestCase):
+    def _context_with(self, *urls):
+        pages = [_make_page(u) for u in urls]
+        context = MagicMock()
+        context.pages = pages
+        context.new_page = AsyncMock(return_value=_make_page("about:blank"))
+        for p in pages:
+            p.context = context
+            p.bring_to_front = AsyncMock()
+        return context, pages
+
+    def test_existing_tab_is_reused(self):
+        context, (current, whatsapp) = self._context_with("https://example.com/", "https://web.whatsapp.com/")
+        loop = _make_loop(current)
+
+        result = asyncio.run(loop._execute_new_tab(NewTabAction(url="web.whatsapp.com"), None))
+
+        self.assertTrue(result.success)
+        self.assertIs(loop.page, whatsapp)
+        whatsapp.bring_to_front.assert_awaited_once()
+        context.new_page.assert_not_awaited()
+
+    def test_unknown_url_opens_a_new_tab(self):
+        context, (current,) = self._context_with("https://example.com/")
+        loop = _make_loop(current)
+
+        result = asyncio.run(loop._execute_new_tab(NewTabAction(url="https://github.com"), None))
+
+        self.assertTrue(result.success)
+        new_page = context.new_page.return_value
+        self.assertIs(loop.page, new_page)
+        new_page.goto.assert_awaited_once_with("https://github.com", wait_until="domcontentloaded")
+
+    def test_blank_tab_is_never_reused(self):
+        context, (blank,) = self._context_with("about:blank")
+        loop = _make_loop(blank)
+
+        asyncio.run(loop._execute_new_tab(NewTabAction(url="about:blank"), None))
+
+        context.new_page.assert_awaited_once()
+        context.new_page.return_value.goto.assert_not_awaited()
+
+
+class TestWait(unittest.TestCase):
+    def test_short_wait_completes(self):
+        loop = _make_loop(None)
+
+        result = asyncio.run(loop._execute_wait(WaitAction(seconds=0.05), None))
+
+        self.assertTrue(result.success)
+
+    def test_cancel_interrupts_wait(self):
+        loop = _make_loop(None)
+        threading.Timer(0.1, loop.cancel).start()
+
+        start = time.monotonic()
+        result = asyncio.run(loop._execute_wait(WaitAction(seconds=10), None))
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "Cancelled during wait")
+
+    def test_wait_does_not_block_the_event_loop(self):
+        loop = _make_loop(None)
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        async def main():
+            await asyncio.gather(loop._execute_wait(WaitAction(seconds=0.2), None), ticker())
+
+        asyncio.run(main())
+
+        self.assertEqual(len(ticks), 3)
+        self.assertLess(ticks[-1] - ticks[0], 0.15)
+
+
+class TestActionDispatch(unittest.TestCase):
+    def test_every_action_but_done_has_a_handler(self):
+        self.assertEqual(set(AgentLoop._ACTION_HANDLERS), set(ACTION_NAMES) - {"done"})
+        for name in AgentLoop._ACTION_HANDLERS.values():
+            with self.subTest(handler=name):
+                self.assertTrue(callable(getattr(AgentLoop, name, None)))
+
+    def test_computer_call_is_dispatched(self):
+        loop = _make_loop(None)
+        loop.computer = MagicMock()
+        action = ActionModel(computer_call=ComputerCallAction(call="computer.clipboard.get()"))
+
+        with patch("autobot.computer.dispatch.dispatch_computer_call", AsyncMock(return_value=(True, "hi"))) as call:
+            result = asyncio.run(loop._execute_single_action(action, None))
+
+        call.assert_awaited_once_with(loop.computer, "computer.clipboard.get()")
+        self.assertTrue(result.success)
+        self.assertEqual(result.extracted_content, "hi")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from autobot.computer import browser
+from autobot.computer.browser import Browser
+
+
+class TestReadMany(unittest.TestCase):
+    def _patch_eval(self, result=None, error=None):
+        calls = []
+
+        async def fake_eval(js, *args, **kwargs):
+            calls.append(js)
+            if error is not None:
+                raise error
+            return result
+
+        patcher = patch("autobot.computer.browser._cdp_eval", fake_eval)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return calls
+
+    def test_all_selectors_read_in_one_call(self):
+        selectors = ["h1", ".price", "#status"]
+        calls = self._patch_eval(json.dumps(["Title", "$5", ""]))
+
+        result = Browser().read_many(selectors)
+
+        self.assertEqual(result, {"h1": "Title", ".price": "$5", "#status": ""})
+        self.assertEqual(len(calls), 1)
+        self.assertIn(json.dumps(selectors), calls[0])
+
+    def test_max_chars_is_applied_in_page(self):
+        calls = self._patch_eval(json.dumps(["x"]))
+
+        Browser().read_many(["main"], max_chars=20)
+
+        self.assertIn(".slice(0, 20)", calls[0])
+
+    def test_cdp_failure_maps_every_selector_to_empty(self):
+        self._patch_eval(error=ConnectionError("no browser"))
+
+        self.assertEqual(Browser().read_many(["a", "b"]), {"a": "", "b": ""})
+
+    def test_no_tab_maps_every_selector_to_empty(self):
+        self._patch_eval(None)
+
+        self.assertEqual(Browser().read_many(["a", "b"]), {"a": "", "b": ""})
+
+    def test_mismatched_reply_maps_every_selector_to_empty(self):
+        self._patch_eval(json.dumps(["only one"]))
+
+        self.assertEqual(Browser().read_many(["a", "b"]), {"a": "", "b": ""})
+
+
+class TestCDPSessionPool(unittest.TestCase):
+    def setUp(self):
+        saved = dict(browser._pool)
+        browser._pool.clear()
+        self.addCleanup(lambda: (browser._pool.clear(), browser._pool.update(saved)))
+
+    def test_evicted_connection_is_closed_before_the_new_one_is_used(self):
+        async def main():
+            stale = [MagicMock(close=AsyncMock()) for _ in range(browser._POOL_MAX)]
+            for i, client in enumerate(stale):
+                browser._pool[f"ws://tab{i}"] = (client, asyncio.Lock())
+            fresh = MagicMock(connected=True)
+            with patch("autobot.dom.page_snapshot.CDPClient", return_value=fresh):
+                async with browser._cdp_session("ws://new") as client:
+                    self.assertIs(client, fresh)
+                    stale[0].close.assert_awaited_once()
+            return stale
+
+        stale = asyncio.run(main())
+
+        self.assertNotIn("ws://tab0", browser._pool)
+        self.assertEqual(len(browser._pool), browser._POOL_MAX)
+        for client in stale[1:]:
+            client.close.assert_not_awaited()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import asyncio
+import gc
+import unittest
+import weakref
+
+from autobot.computer.dispatch import (
+    DispatchError,
+    _parse_call_args,
+    dispatch_computer_call,
+    parse_computer_call,
+    resolve_target,
+)
+
+
+class _Keyboard:
+    def press(self, key):
+        return f"pressed {key}"
+
+
+class _Computer:
+    def __init__(self):
+        self.keyboard = _Keyboard()
+
+    def get_tool_catalog(self):
+        return "catalog"
+
+
+class TestParseComputerCall(unittest.TestCase):
+    def test_repeated_call_reuses_the_parsed_arguments(self):
+        call = "computer.browser.read_many(['h1', '.price'], max_chars=200)"
+        first = parse_computer_call(call)
+        hits = _parse_call_args.cache_info().hits
+        self.assertEqual(parse_computer_call(call), first)
+        self.assertEqual(_parse_call_args.cache_info().hits, hits + 1)
+
+    def test_mutable_arguments_are_not_shared_between_calls(self):
+        call = "computer.browser.fill([1, 2], opts={'a': [3]})"
+        _, _, args, kwargs = parse_computer_call(call)
+        args[0].append(99)
+        kwargs["opts"]["a"].append(99)
+        kwargs["extra"] = True
+
+        self.assertEqual(parse_computer_call(call), ("browser", "fill", [[1, 2]], {"opts": {"a": [3]}}))
+
+    def test_syntax_error_raises_every_time(self):
+        for _ in range(2):
+            with self.assertRaisesRegex(DispatchError, "could not parse arguments"):
+                parse_computer_call("computer.keyboard.press(1 +)")
+
+
+class TestResolveTarget(unittest.TestCase):
+    def test_repeated_lookup_returns_cached_target(self):
+        computer = _Computer()
+        first = resolve_target(computer, "keyboard", "press")
+        self.assertIs(resolve_target(computer, "keyboard", "press"), first)
+
+    def test_swapped_module_is_re_resolved(self):
+        computer = _Computer()
+        old = resolve_target(computer, "keyboard", "press")
+        computer.keyboard = _Keyboard()
+        new = resolve_target(computer, "keyboard", "press")
+        self.assertIsNot(new.__self__, old.__self__)
+        self.assertIs(new.__self__, computer.keyboard)
+
+    def test_failures_are_not_cached(self):
+        computer = _Computer()
+        with self.assertRaises(DispatchError):
+            resolve_target(computer, "keyboard", "release")
+        _Keyboard.release = lambda self, key: key
+        try:
+            self.assertEqual(resolve_target(computer, "keyboard", "release")("a"), "a")
+        finally:
+            del _Keyboard.release
+
+    def test_computer_is_collectable_after_dispatch(self):
+        computer = _Computer()
+        ok, _ = asyncio.run(dispatch_computer_call(computer, "computer.get_tool_catalog()"))
+        self.assertTrue(ok)
+        ok, _ = asyncio.run(dispatch_computer_call(computer, "computer.keyboard.press('enter')"))
+        self.assertTrue(ok)
+        ref = weakref.ref(computer)
+        del computer
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+if __name__ == '__main__':
+    unittest.main()
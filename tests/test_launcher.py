@@ -0,0 +1,31 @@
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+from autobot.browser.launcher import AsyncBrowserLauncher, _invalidate_launcher_cache
+
+
+class TestLauncherSettingsCache(unittest.TestCase):
+    def setUp(self):
+        _invalidate_launcher_cache()
+        self.addCleanup(_invalidate_launcher_cache)
+
+    def test_from_env_is_read_once(self):
+        with patch.dict(os.environ, {"AUTOBOT_CHROME_EXECUTABLE": "/missing/chrome-a"}):
+            self.assertEqual(AsyncBrowserLauncher.from_env().chrome_path, "/missing/chrome-a")
+        with patch.dict(os.environ, {"AUTOBOT_CHROME_EXECUTABLE": "/missing/chrome-b"}):
+            self.assertEqual(AsyncBrowserLauncher.from_env().chrome_path, "/missing/chrome-a")
+
+    def test_missing_chrome_forgets_cached_settings(self):
+        with patch.dict(os.environ, {"AUTOBOT_CHROME_EXECUTABLE": "/missing/chrome-a"}):
+            launcher = AsyncBrowserLauncher.from_env()
+        with self.assertRaises(RuntimeError):
+            asyncio.run(launcher._launch_chrome())
+
+        with patch.dict(os.environ, {"AUTOBOT_CHROME_EXECUTABLE": "/missing/chrome-b"}):
+            self.assertEqual(AsyncBrowserLauncher.from_env().chrome_path, "/missing/chrome-b")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from autobot.memory.store import MemoryStore
+
+
+class TestMemoryStoreBatch(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "memory.json"
+        # AUTOBOT_MEMORY_PATH would override the path passed in.
+        env = patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("AUTOBOT_MEMORY_PATH", None)
+        self.store = MemoryStore(self.path)
+        saver = patch.object(self.store, "_save", wraps=self.store._save)
+        self.save = saver.start()
+        self.addCleanup(saver.stop)
+
+    def _on_disk(self):
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+    def test_remember_outside_batch_saves_each_time(self):
+        self.store.remember("a", "1")
+        self.store.remember("b", "2")
+        self.assertEqual(self.save.call_count, 2)
+
+    def test_batch_saves_once(self):
+        with self.store.batch():
+            for i in range(5):
+                self.store.remember(f"key {i}", str(i))
+            self.store.forget("key 0")
+            self.assertEqual(self.save.call_count, 0)
+
+        self.assertEqual(self.save.call_count, 1)
+        self.assertEqual(sorted(self._on_disk()), ["key_1", "key_2", "key_3", "key_4"])
+
+    def test_nested_batches_save_once_at_the_outermost_exit(self):
+        with self.store.batch():
+            with self.store.batch():
+                self.store.remember("a", "1")
+            self.assertEqual(self.save.call_count, 0)
+            self.store.remember("b", "2")
+
+        self.assertEqual(self.save.call_count, 1)
+        self.assertEqual(sorted(self._on_disk()), ["a", "b"])
+
+    def test_batch_still_saves_when_the_block_raises(self):
+        with self.assertRaises(RuntimeError):
+            with self.store.batch():
+                self.store.remember("a", "1")
+                raise RuntimeError("boom")
+
+        self.assertEqual(self.save.call_count, 1)
+        self.assertEqual(self._on_disk()["a"]["value"], "1")
+
+    def test_batch_without_changes_does_not_save(self):
+        with self.store.batch():
+            self.store.forget("missing")
+
+        self.save.assert_not_called()
+        self.assertFalse(self.path.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from autobot.agent.domain.overleaf_helper import OverleafHelper, _page_hits
+
+
+class _FakePage:
+    """Answers the batched probe with `probe` and is_visible() from `visible`."""
+
+    def __init__(self, probe, visible=()):
+        self.probe = probe
+        self.visible = set(visible)
+        self.locators = {}
+        self.handlers = {}
+        self.main_frame = MagicMock(parent_frame=None)
+
+    async def evaluate(self, js, selectors):
+        return list(self.probe)
+
+    def locator(self, sel):
+        if sel not in self.locators:
+            loc = MagicMock()
+            loc.count = AsyncMock(return_value=1)
+            loc.first.is_visible = AsyncMock(side_effect=lambda s=sel: s in self.visible)
+            loc.first.click = AsyncMock()
+            self.locators[sel] = loc
+        return self.locators[sel]
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def union_counts(self):
+        return sum(loc.count.await_count for loc in self.locators.values())
+
+
+# new_project_button: three Playwright-only candidates, two plain CSS.
+_NEW_PROJECT_PROBE = [None, None, False, None, False]
+_NEW_PROJECT = "button:has-text('New Project')"
+
+
+class TestFindAndClick(unittest.TestCase):
+    def _click(self, page, key="new_project_button"):
+        return asyncio.run(OverleafHelper.find_and_click(page, key))
+
+    def test_winner_skips_the_union_count_on_the_same_document(self):
+        page = _FakePage(_NEW_PROJECT_PROBE, visible={_NEW_PROJECT})
+        self.assertTrue(self._click(page))
+        self.assertEqual(page.union_counts(), 1)
+
+        self.assertTrue(self._click(page))
+
+        self.assertEqual(page.union_counts(), 1)
+        self.assertEqual(page.locator(_NEW_PROJECT).first.click.await_count, 2)
+
+    def test_main_frame_navigation_forgets_the_winner(self):
+        page = _FakePage(_NEW_PROJECT_PROBE, visible={_NEW_PROJECT})
+        self._click(page)
+
+        page.handlers["framenavigated"](MagicMock(parent_frame=page.main_frame))
+        self.assertEqual(_page_hits(page), {"new_project_button": _NEW_PROJECT})
+        page.handlers["framenavigated"](page.main_frame)
+        self.assertEqual(_page_hits(page), {})
+
+    def test_remembered_selector_is_rechecked_before_clicking(self):
+        page = _FakePage(_NEW_PROJECT_PROBE, visible={_NEW_PROJECT})
+        self._click(page)
+        page.visible = {"a:has-text('New Project')"}
+
+        self.assertTrue(self._click(page))
+
+        self.assertEqual(page.locator(_NEW_PROJECT).first.click.await_count, 1)
+        page.locator("a:has-text('New Project')").first.click.assert_awaited_once()
+
+    def test_plain_css_winner_is_not_remembered(self):
+        page = _FakePage([False, True, False, False])
+
+        self.assertTrue(self._click(page, "project_name_input"))
+
+        page.locator("input[type='text']").first.click.assert_awaited_once()
+        self.assertEqual(_page_hits(page), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
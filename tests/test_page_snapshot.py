@@ -0,0 +1,87 @@
+import asyncio
+import json
+import unittest
+
+from autobot.dom.page_snapshot import CDPClient
+
+
+class _FakeSocket:
+    """Replies to each command after a per-call delay, like a real tab would."""
+
+    def __init__(self, delays):
+        self._delays = list(delays)
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self.sent = []
+
+    async def send(self, raw):
+        msg = json.loads(raw)
+        self.sent.append(msg)
+        delay = self._delays.pop(0)
+        asyncio.get_running_loop().call_later(
+            delay, self._inbox.put_nowait, json.dumps({"id": msg["id"], "result": {"n": msg["id"]}})
+        )
+
+    async def push_event(self):
+        await self._inbox.put(json.dumps({"method": "Runtime.consoleAPICalled", "params": {}}))
+
+    async def recv(self):
+        return await self._inbox.get()
+
+
+def _client(sock):
+    client = CDPClient("ws://fake")
+    client._ws = sock
+    return client
+
+
+class TestCDPClientCall(unittest.TestCase):
+    def test_reply_within_timeout_is_returned(self):
+        async def main():
+            client = _client(_FakeSocket([0.3]))
+            return await client.call("Runtime.evaluate", {}, timeout=1.0)
+
+        self.assertEqual(asyncio.run(main()), {"n": 1})
+
+    def test_late_reply_gives_empty_result(self):
+        async def main():
+            client = _client(_FakeSocket([0.5]))
+            return await client.call("Runtime.evaluate", {}, timeout=0.1)
+
+        self.assertEqual(asyncio.run(main()), {})
+
+    def test_events_do_not_extend_the_deadline(self):
+        async def main():
+            sock = _FakeSocket([5.0])
+            client = _client(sock)
+
+            async def chatter():
+                for _ in range(20):
+                    await sock.push_event()
+                    await asyncio.sleep(0.02)
+
+            task = asyncio.ensure_future(chatter())
+            start = asyncio.get_running_loop().time()
+            result = await client.call("Runtime.evaluate", {}, timeout=0.2)
+            elapsed = asyncio.get_running_loop().time() - start
+            task.cancel()
+            return result, elapsed
+
+        result, elapsed = asyncio.run(main())
+        self.assertEqual(result, {})
+        self.assertLess(elapsed, 1.0)
+
+    def test_stale_reply_is_not_taken_for_the_next_call(self):
+        async def main():
+            client = _client(_FakeSocket([0.2, 0.3]))
+            first = await client.call("Runtime.evaluate", {}, timeout=0.05)
+            # The reply to call 1 arrives while call 2 is waiting.
+            second = await client.call("Runtime.evaluate", {}, timeout=1.0)
+            return first, second
+
+        first, second = asyncio.run(main())
+        self.assertEqual(first, {})
+        self.assertEqual(second, {"n": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from autobot.knowledge.skill_distiller import SkillDistiller
+
+
+def _skill(name, keywords):
+    return {
+        "name": name,
+        "description": f"{name} description",
+        "keywords": keywords,
+        "prerequisites": [],
+        "proven_steps": [],
+        "lessons_learned": [],
+        "created_at": "2026-01-01T00:00:00+00:00",
+    }
+
+
+class TestFindMatchingSkill(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.skills_dir = Path(self._tmp.name)
+        self.distiller = SkillDistiller(self.skills_dir)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, filename, data):
+        (self.skills_dir / filename).write_text(json.dumps(data), encoding="utf-8")
+
+    def test_malformed_skill_does_not_shadow_valid_one(self):
+        # Scores higher on keywords (3/3) but is missing required fields.
+        self._write("broken.json", {"name": "broken", "keywords": ["compile", "latex", "overleaf"]})
+        self._write("valid.json", _skill("valid", ["compile", "latex", "paper", "draft"]))
+
+        skill = self.distiller.find_matching_skill("compile the latex document on overleaf")
+
+        self.assertIsNotNone(skill)
+        self.assertEqual(skill.name, "valid")
+
+    def test_best_overlap_wins(self):
+        self._write("weak.json", _skill("weak", ["compile", "latex", "paper", "draft"]))
+        self._write("strong.json", _skill("strong", ["compile", "latex"]))
+
+        skill = self.distiller.find_matching_skill("compile latex")
+
+        self.assertEqual(skill.name, "strong")
+
+    def test_edited_skill_file_is_reloaded(self):
+        path = self.skills_dir / "skill.json"
+        self._write("skill.json", _skill("old", ["compile", "latex"]))
+        self.assertEqual(self.distiller.find_matching_skill("compile latex").name, "old")
+
+        self._write("skill.json", _skill("new", ["compile", "latex"]))
+        stat = path.stat()
+        # Guarantee a different mtime even on coarse-grained filesystems.
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self.distiller.find_matching_skill("compile latex").name, "new")
+
+
+if __name__ == '__main__':
+    unittest.main()